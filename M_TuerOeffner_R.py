@@ -7,9 +7,14 @@
 # Modified: October 17, 2025, 12:10 UTC - Korrektur: Sauberes Beenden des Hauptprogramms nach Initialisierungsfehler und Task-Cleanup.
 # Modified: November 07, 2025, 15:05 UTC - Logging-Refactor: Benannter Logger, Präfixe entfernt, redundante Log-Konfig entfernt.
 # Modified: November 09, 2025, 13:55 UTC - Anpassung an neue Task-Struktur von radar_logic.py (reader/logic).
+# Modified: October 16, 2026, 09:40 UTC - Ungenutzten Import entfernt (sys).
+# Modified: October 16, 2026, 14:10 UTC - multiprocessing.set_start_method('spawn') entfernt (es werden keine Prozesse gestartet).
+# Modified: October 16, 2026, 15:10 UTC - clear_pycache() nur noch bei gesetzter Umgebungsvariable TUEROEFFNER_CLEAR_PYCACHE (Bytecode-Cache bleibt sonst warm).
+# Modified: October 16, 2026, 20:10 UTC - TUEROEFFNER_CLEAR_PYCACHE nur bei Wert "1" aktiv (wie in README dokumentiert).
+# Modified: October 16, 2026, 18:15 UTC - weather_update_task (display_logic) wird zusammen mit dem Display-Manager gestartet und beendet.
 
 import asyncio
-import multiprocessing
+import os
 import logging
 
 # Import der modularen Komponenten
@@ -18,7 +23,6 @@ import globals_state as gs
 import ble_logic_R
 import display_logic
 import radar_logic
-import sys
 import shutil
 from pathlib import Path
 
@@ -42,6 +46,7 @@ async def main():
 
     # Variablen für Tasks, um sie im finally-Block referenzieren zu können
     display_task = None
+    weather_task = None
     radar_reader_task = None # NEU
     radar_logic_task = None  # NEU
     
@@ -57,6 +62,9 @@ async def main():
             # Starte den Display-Manager-Task nur, wenn die Hardware erfolgreich initialisiert wurde
             display_task = asyncio.create_task(display_logic.display_manager_task())
             log.info("Display-Manager-Task gestartet.")
+            # Wetterdaten werden nur für das Display benötigt
+            weather_task = asyncio.create_task(display_logic.weather_update_task())
+            log.info("Wetter-Task gestartet.")
         except Exception as e:
             log.error(f"Fehler bei der Initialisierung der Display-Hardware: {e}. System läuft ohne Display.", exc_info=True)
             # gs.display bleibt None, was vom display_manager_task gehandhabt wird
@@ -72,7 +80,7 @@ async def main():
 
         # Warte auf das Beenden aller Tasks (sollte im Normalfall nicht passieren, da sie Endlosschleifen sind)
         # Füge nur Tasks hinzu, die auch tatsächlich gestartet wurden
-        tasks_to_gather = [t for t in [radar_reader_task, radar_logic_task, display_task] if t is not None]
+        tasks_to_gather = [t for t in [radar_reader_task, radar_logic_task, display_task, weather_task] if t is not None]
         if tasks_to_gather:
             await asyncio.gather(*tasks_to_gather)
         else:
@@ -96,10 +104,12 @@ async def main():
             radar_logic_task.cancel()
         if display_task and not display_task.done():
             display_task.cancel()
+        if weather_task and not weather_task.done():
+            weather_task.cancel()
         
         # Warte, bis alle Tasks tatsächlich abgeschlossen sind (mit Timeout, falls sie hängen bleiben)
         try:
-            tasks_to_wait_for = [t for t in [radar_reader_task, radar_logic_task, display_task] if t is not None and not t.done()]
+            tasks_to_wait_for = [t for t in [radar_reader_task, radar_logic_task, display_task, weather_task] if t is not None and not t.done()]
             if tasks_to_wait_for:
                 # Warten auf die verbleibenden Tasks mit einem Timeout
                 await asyncio.wait_for(asyncio.gather(*tasks_to_wait_for, return_exceptions=True), timeout=5.0)
@@ -116,8 +126,10 @@ async def main():
 
 # --- Hauptausführung ---
 if __name__ == "__main__":
-    clear_pycache()
-    multiprocessing.set_start_method('spawn', True)
+    # Python invalidiert .pyc-Dateien selbst über die mtime der Quelldatei; das Löschen
+    # kostet bei jedem Start eine komplette Neukompilierung und ist nur noch optional.
+    if os.environ.get("TUEROEFFNER_CLEAR_PYCACHE") == "1":
+        clear_pycache()
 
     try:
         asyncio.run(main())
@@ -6,13 +6,38 @@
 # Modified: October 16, 2025, 10:55 UTC - Erstellung des ble_logic_R-Moduls für Radar-Integration.
 # Modified: October 17, 2025, 14:45 UTC - Anpassung der Log-Meldungen für bessere Sichtbarkeit bei INFO-Level.
 # Modified: November 07, 2025, 14:22 UTC - Logging-Refactor: Benannter Logger, DEBUG/INFO->TRACE, Präfixe entfernt, gs.TRACE_MODE entfernt.
+# Modified: October 16, 2026, 08:10 UTC - iBeacon-Filter: UUID wird als Rohbytes verglichen, bevor Major/Minor entpackt werden (kein bytes_to_uuid pro Paket).
+# Modified: October 16, 2026, 08:25 UTC - Major/Minor werden über ein vorkompiliertes struct.Struct in einem Aufruf entpackt.
+# Modified: October 16, 2026, 08:55 UTC - auth_criteria und Eddystone Namespace ID werden einmal pro Scan gelesen und von der Callback-Closure genutzt (kein config.get() pro Paket).
+# Modified: October 16, 2026, 09:10 UTC - TRACE-Meldung für unbekannte Beacons mit %-Argumenten (Formatierung nur, wenn TRACE aktiv ist).
+# Modified: October 16, 2026, 09:25 UTC - iBeacon-Erkennung über einen einzigen startswith()-Vergleich mit vorberechnetem Präfix (Typ 0x02 0x15 + Ziel-UUID).
+# Modified: October 16, 2026, 09:40 UTC - Ungenutzte Importe entfernt (os, perf_counter).
+# Modified: October 16, 2026, 09:55 UTC - Apple Manufacturer Data mit einem einzigen .get() gelesen (statt 'in' + Indexzugriff).
+# Modified: October 16, 2026, 10:10 UTC - Optionaler passiver BlueZ-Scan mit Kernel-Filtern (iBeacon/Eddystone), gesteuert über radar_config.ble_passive_scan.
+# Modified: October 16, 2026, 10:25 UTC - bytes_to_uuid() bei fremden iBeacons nur noch aufgerufen, wenn TRACE aktiv ist.
+# Modified: October 16, 2026, 10:40 UTC - Eddystone-TRACE-Meldungen mit hex()-Dumps hinter isEnabledFor(TRACE) (kein String-Aufbau bei abgeschaltetem TRACE).
+# Modified: October 16, 2026, 10:55 UTC - last_packet_time über time.monotonic().
+# Modified: October 16, 2026, 11:10 UTC - advertisement_data.service_data einmal in lokale Variable geladen.
+# Modified: October 16, 2026, 11:25 UTC - Fast-Reject unbekannter MACs über ein einziges dict.get() auf die per Scan gebundene Zustandstabelle.
+# Modified: October 16, 2026, 11:40 UTC - auth_criteria einmal pro Scan in REQUIRED-/OPTIONAL-Bitmasken übersetzt; Identifikationsprüfung per Bit-Operation.
+# Modified: October 16, 2026, 11:55 UTC - decode_eddystone_url über 256-Einträge-Lookup-Tabellen (kein Dict-Hashing und keine String-Verkettung pro Byte).
+# Modified: October 16, 2026, 12:10 UTC - Erwarteter iBeacon-Payload (Typ + UUID + Major + Minor) pro MAC einmal pro Scan vorberechnet; Match per startswith(), Ergebnis-Dict wiederverwendet.
+# Modified: October 16, 2026, 12:25 UTC - Eddystone UID (Namespace + Instance) pro MAC als Rohbytes vorberechnet; Vergleich ohne hex().upper() pro Paket.
+# Modified: October 16, 2026, 12:40 UTC - encode_eddystone_url(): erwartete URL einmal pro Scan kodiert; Match per Bytevergleich, Dekodieren nur noch als Fallback.
+# Modified: October 16, 2026, 12:55 UTC - Beacon-Zustand als @dataclass(slots=True) BeaconState statt Dict; erfüllte Kriterien als Bitmaske im Zustand.
+# Modified: October 16, 2026, 13:10 UTC - Eddystone Service Data über ein einziges .get() mit Modul-Konstante; Frame-Typen als Konstanten.
+# Modified: October 16, 2026, 13:25 UTC - Eddystone Frame-Typen über eine Dispatch-Tabelle (_parse_eddystone_uid/_url/_tlm) statt if/elif-Kette; Warnung bei fehlender Namespace ID einmal pro Scan.
+# Modified: October 16, 2026, 13:40 UTC - TRACE-Meldungen im Paketpfad mit %-Argumenten statt f-Strings (Formatierung nur bei aktivem TRACE).
+# Modified: October 16, 2026, 13:55 UTC - Bereits vollständig identifizierte Beacons werden nicht erneut geparst (nur last_packet_time + Event).
+# Modified: October 16, 2026, 20:00 UTC - Eddystone UID: Längen von Namespace (10 Bytes) und Instance (6 Bytes) geprüft, exakter 16-Byte-Vergleich; Warnungen nur bei aktivem UID-Kriterium, %-Style.
+# Modified: October 16, 2026, 20:20 UTC - Lokale Konstante _TRACE entfernt, stattdessen config.TRACE_LEVEL.
 
 import asyncio
 import time
-import os
 import struct
 import logging
-from time import perf_counter
+from dataclasses import dataclass, field
+from typing import Optional
 
 from bleak import BleakScanner
 
@@ -22,6 +47,54 @@ import globals_state as gs
 # NEU: Benannter Logger (Phase 2.2)
 log = logging.getLogger(__name__)
 
+# iBeacon-Payload ab Offset 18: Major, Minor (Big-Endian, je 2 Bytes).
+# Einmal kompiliert, damit der Format-String nicht pro Paket geparst wird.
+_IBEACON_MAJOR_MINOR = struct.Struct(">HH")
+# iBeacon-Kennung im Apple Manufacturer Data: Typ 0x02, Länge 0x15
+_IBEACON_TYPE = b"\x02\x15"
+# Eddystone Service UUID 0xFEAA (Little-Endian im Service-Data-AD-Feld)
+_EDDYSTONE_SERVICE_UUID16_LE = b"\xaa\xfe"
+# Dieselbe UUID als Schlüssel in advertisement_data.service_data (von Bleak als 128-Bit-String geliefert)
+_EDDYSTONE_SERVICE_UUID = "0000feaa-0000-1000-8000-00805f9b34fb"
+# Eddystone Frame-Typen (erstes Payload-Byte)
+_EDDYSTONE_FRAME_UID = 0x00
+_EDDYSTONE_FRAME_URL = 0x10
+_EDDYSTONE_FRAME_TLM = 0x20
+
+# Authentifizierungskriterien als Bits: (Schlüssel in auth_criteria, Anzeigename)
+_AUTH_CRITERIA = (
+    ("ibeacon", "iBeacon"),              # Bit 0
+    ("eddystone_uid", "Eddystone UID"),  # Bit 1
+    ("eddystone_url", "Eddystone URL"),  # Bit 2
+    ("mac_address", "MAC Address"),      # Bit 3 (durch den MAC-Lookup immer erfüllt)
+)
+_CRITERION_IBEACON = 1 << 0
+_CRITERION_UID = 1 << 1
+_CRITERION_URL = 1 << 2
+_CRITERION_MAC = 1 << 3
+
+# Eddystone-URL-Kodierung als Lookup-Tabellen, direkt über den Bytewert indiziert
+_EDDYSTONE_URL_SCHEMES = ("http://www.", "https://www.", "http://", "https://") + ("",) * 252
+_EDDYSTONE_URL_SUFFIXES = (
+    b".com/", b".org/", b".edu/", b".net/", b".info/", b".biz/", b".gov/",
+    b".com", b".org", b".edu", b".net", b".info", b".biz", b".gov",
+)
+# Byte 0x00-0x0d -> Suffix, alle anderen Bytes -> unverändert
+_EDDYSTONE_URL_EXPANSION = _EDDYSTONE_URL_SUFFIXES + tuple(bytes((b,)) for b in range(len(_EDDYSTONE_URL_SUFFIXES), 256))
+
+@dataclass(slots=True)
+class BeaconState:
+    """Identifikationszustand eines bekannten Beacons (Eintrag in gs.beacon_identification_state)."""
+    name: str
+    is_allowed: bool
+    known_beacon_config: dict = field(default_factory=dict) # Vollständige Config für Vergleiche
+    ibeacon_data: Optional[dict] = None
+    uid_data: Optional[dict] = None
+    url_data: Optional[str] = None
+    last_packet_time: float = 0.0 # time.monotonic(); wird durch perform_on_demand_identification aktualisiert
+    is_fully_identified: bool = False
+    criteria_mask: int = _CRITERION_MAC # Bereits erfüllte Kriterien (Bits wie _AUTH_CRITERIA); MAC ist durch den Lookup immer erfüllt
+
 # --- BLE Hilfsfunktionen ---
 def bytes_to_uuid(b):
     if len(b) != 16:
@@ -29,45 +102,144 @@ def bytes_to_uuid(b):
         return None
     return f"{b[0:4].hex()}-{b[4:6].hex()}-{b[6:8].hex()}-{b[8:10].hex()}-{b[10:16].hex()}".upper()
 
-def decode_eddystone_url(payload_bytes_starting_with_scheme):
-    url_schemes = {
-        0x00: "http://www.", 0x01: "https://www.", 0x02: "http://", 0x03: "https://",
-    }
-    url_suffixes = {
-        0x00: ".com/", 0x01: ".org/", 0x02: ".edu/", 0x03: ".net/", 0x04: ".info/",
-        0x05: ".biz/", 0x06: ".gov/", 0x07: ".com", 0x08: ".org", 0x09: ".edu",
-        0x0a: ".net", 0x0b: ".info", 0x0c: ".biz", 0x0d: ".gov",
-    }
+def uuid_to_bytes(uuid_str):
+    """Gegenstück zu bytes_to_uuid: Wandelt 'XXXXXXXX-XXXX-...' in 16 Rohbytes um (None bei ungültigem Wert)."""
+    try:
+        b = bytes.fromhex(uuid_str.replace("-", ""))
+    except (AttributeError, ValueError):
+        return None
+    return b if len(b) == 16 else None
+
+def _create_scanner(detection_callback):
+    """
+    Erzeugt den BleakScanner. Ist radar_config.ble_passive_scan aktiv, wird ein passiver
+    BlueZ-Scan mit or_patterns angefordert, sodass der Kernel nur Apple-iBeacon- und
+    Eddystone-Pakete an den Callback weiterreicht. Bei Fehlern (kein BlueZ, zu alte
+    BlueZ-/Bleak-Version) wird auf den normalen aktiven Scan zurückgefallen.
+    """
+    if config.get("radar_config.ble_passive_scan", False):
+        try:
+            from bleak.assigned_numbers import AdvertisementDataType
+            from bleak.backends.bluezdbus.advertisement_monitor import OrPattern
+
+            or_patterns = [
+                OrPattern(0, AdvertisementDataType.MANUFACTURER_SPECIFIC_DATA, b"\x4c\x00" + _IBEACON_TYPE),
+                OrPattern(0, AdvertisementDataType.SERVICE_DATA_UUID16, _EDDYSTONE_SERVICE_UUID16_LE),
+            ]
+            return BleakScanner(
+                detection_callback=detection_callback,
+                scanning_mode="passive",
+                bluez={"or_patterns": or_patterns},
+            )
+        except Exception as e:
+            log.warning(f"Passiver BLE-Scan nicht verfügbar, verwende aktiven Scan: {e}")
+    return BleakScanner(detection_callback=detection_callback)
+
+def _auth_criteria_mask(auth_criteria, mode):
+    """Bitmaske aller Kriterien, die in auth_criteria auf 'mode' (REQUIRED/OPTIONAL) stehen."""
+    mask = 0
+    for bit, (key, _) in enumerate(_AUTH_CRITERIA):
+        if auth_criteria.get(key, "DISABLED") == mode:
+            mask |= 1 << bit
+    return mask
+
+def _criteria_names(mask, optional_mask=0):
+    """Anzeigenamen der in 'mask' gesetzten Kriterien (nur für Log-Meldungen)."""
+    return [
+        f"{name} (Optional)" if optional_mask & (1 << bit) else name
+        for bit, (_, name) in enumerate(_AUTH_CRITERIA)
+        if mask & (1 << bit)
+    ]
 
-    if not payload_bytes_starting_with_scheme or len(payload_bytes_starting_with_scheme) < 1:
+def decode_eddystone_url(payload_bytes_starting_with_scheme):
+    if not payload_bytes_starting_with_scheme:
         log.trace("decode_eddystone_url: Empty or too short payload.")
         return None
 
     scheme_byte = payload_bytes_starting_with_scheme[0]
-    url_result = url_schemes.get(scheme_byte, "")
-    if not url_result:
-        log.trace(f"decode_eddystone_url: Unknown scheme byte {hex(scheme_byte)}")
+    url_scheme = _EDDYSTONE_URL_SCHEMES[scheme_byte]
+    if not url_scheme:
+        log.trace("decode_eddystone_url: Unknown scheme byte %#x", scheme_byte)
         return None
 
-    i = 1 # Start from the byte after the scheme byte
-    while i < len(payload_bytes_starting_with_scheme):
-        byte_val = payload_bytes_starting_with_scheme[i]
-        if byte_val in url_suffixes:
-            url_result += url_suffixes[byte_val]
+    # Jedes Byte über die Tabelle expandieren (Suffix-Code oder das Byte selbst); map/join laufen in C
+    url_body = b"".join(map(_EDDYSTONE_URL_EXPANSION.__getitem__, payload_bytes_starting_with_scheme[1:]))
+    return url_scheme + url_body.decode('utf-8', errors='ignore')
+
+def encode_eddystone_url(url_str):
+    """
+    Gegenstück zu decode_eddystone_url: Kodiert eine URL in das Eddystone-URL-Format
+    (Scheme-Byte + Text mit Suffix-Codes). Gibt None zurück, wenn kein Scheme passt.
+    """
+    if not url_str:
+        return None
+    # Längstes passendes Scheme zuerst ("https://www." vor "https://")
+    for scheme_code in sorted(range(4), key=lambda c: -len(_EDDYSTONE_URL_SCHEMES[c])):
+        scheme = _EDDYSTONE_URL_SCHEMES[scheme_code]
+        if url_str.startswith(scheme):
+            break
+    else:
+        return None
+
+    text = url_str[len(scheme):].encode('utf-8')
+    # Längere Suffixe zuerst (".com/" vor ".com")
+    suffix_codes = sorted(range(len(_EDDYSTONE_URL_SUFFIXES)), key=lambda c: -len(_EDDYSTONE_URL_SUFFIXES[c]))
+    encoded = bytearray((scheme_code,))
+    i = 0
+    while i < len(text):
+        for code in suffix_codes:
+            if text.startswith(_EDDYSTONE_URL_SUFFIXES[code], i):
+                encoded.append(code)
+                i += len(_EDDYSTONE_URL_SUFFIXES[code])
+                break
         else:
-            start_segment = i
-            while i < len(payload_bytes_starting_with_scheme) and payload_bytes_starting_with_scheme[i] not in url_suffixes:
-                i += 1
-            try:
-                url_result += payload_bytes_starting_with_scheme[start_segment:i].decode('utf-8', errors='ignore')
-            except UnicodeDecodeError:
-                log.warning(f"decode_eddystone_url: Could not decode URL segment: {payload_bytes_starting_with_scheme[start_segment:i].hex()}")
-                return None
-            i -= 1
+            encoded.append(text[i])
+            i += 1
+    return bytes(encoded)
+
+# --- Eddystone Frame-Parser (Dispatch über den Frame-Typ) ---
+# Einheitliche Signatur: (payload, mac, expected, trace_enabled) -> erkannter Wert oder None.
+# 'expected' ist der pro Scan vorberechnete Eintrag dieses Beacons (oder None, falls nicht konfiguriert).
+def _parse_eddystone_uid(eddystone_payload, current_mac, expected, trace_enabled):
+    if len(eddystone_payload) < 18:
+        log.trace("UID payload too short for %s: %d bytes", current_mac, len(eddystone_payload))
+        return None
 
-        i += 1
+    if trace_enabled:
+        log.trace("UID Namespace from payload: %s", eddystone_payload[2:12].hex().upper())
+        log.trace("UID Instance from payload: %s", eddystone_payload[12:18].hex().upper())
+
+    # Namespace + Instance (exakt 16 Bytes) in einem Vergleich, ohne hex()
+    if expected is not None and eddystone_payload[2:18] == expected[0]:
+        return expected[1]
+    if trace_enabled:
+        expected_uid = expected[1] if expected is not None else {}
+        log.trace("UID mismatch for %s: Expected Namespace %s, Instance %s, got Namespace %s, Instance %s",
+                  current_mac, expected_uid.get('namespace_id'), expected_uid.get('instance_id'),
+                  eddystone_payload[2:12].hex().upper(), eddystone_payload[12:18].hex().upper())
+    return None
+
+def _parse_eddystone_url(eddystone_payload, current_mac, expected, trace_enabled):
+    if len(eddystone_payload) < 3:
+        log.trace("URL payload too short for %s: %d bytes", current_mac, len(eddystone_payload))
+        return None
+
+    if expected is not None and expected[0] is not None and \
+       len(eddystone_payload) == len(expected[0]) + 2 and eddystone_payload.startswith(expected[0], 2):
+        # Schneller Pfad: Payload ist exakt die kodierte Soll-URL
+        return expected[1]
+
+    # Fallback: andere Kodierung (z.B. ohne Suffix-Codes, Groß-/Kleinschreibung) oder Mismatch
+    parsed_eddystone_url = decode_eddystone_url(eddystone_payload[2:])
+    log.trace("Parsed Eddystone URL for %s: %s", current_mac, parsed_eddystone_url)
+    if expected is not None and parsed_eddystone_url and parsed_eddystone_url.lower() == expected[2]:
+        return parsed_eddystone_url
+    log.trace("URL mismatch for %s: Expected '%s', got '%s'", current_mac, expected[1] if expected is not None else None, parsed_eddystone_url)
+    return None
 
-    return url_result
+def _parse_eddystone_tlm(eddystone_payload, current_mac, expected, trace_enabled):
+    log.trace("Eddystone TLM frame detected for %s. Not parsing.", current_mac)
+    return None
 
 # --- Initialisierung der Beacon-Datenstruktur ---
 async def _perform_initial_beacon_data_setup():
@@ -79,16 +251,11 @@ async def _perform_initial_beacon_data_setup():
     for beacon_cfg in config.SYSTEM_CONFIG["known_beacons"]:
         mac_addr = beacon_cfg.get("mac_address")
         if mac_addr:
-            gs.beacon_identification_state[mac_addr] = {
-                "name": beacon_cfg.get("name", "Unbekannt"),
-                "is_allowed": beacon_cfg.get("is_allowed", False),
-                "ibeacon_data": None,
-                "uid_data": None,
-                "url_data": None,
-                "last_packet_time": 0, # Wird durch perform_on_demand_identification aktualisiert
-                "is_fully_identified": False,
-                "known_beacon_config": beacon_cfg, # Store full config for comparison
-            }
+            gs.beacon_identification_state[mac_addr] = BeaconState(
+                name=beacon_cfg.get("name", "Unbekannt"),
+                is_allowed=beacon_cfg.get("is_allowed", False),
+                known_beacon_config=beacon_cfg,
+            )
     log.info(f"{len(gs.beacon_identification_state)} bekannte Beacons in Datenstruktur initialisiert.")
 
 
@@ -100,187 +267,194 @@ async def perform_on_demand_identification(scan_duration: float) -> bool:
     """
     found_allowed_beacon_event = asyncio.Event()
 
+    # Konfiguration einmal pro Scan lesen; die Callback-Closure greift nur noch auf lokale Werte zu
+    auth_criteria = config.get("auth_criteria", {})
+    required_mask = _auth_criteria_mask(auth_criteria, "REQUIRED")
+    optional_mask = _auth_criteria_mask(auth_criteria, "OPTIONAL")
+    eddystone_namespace_id_from_config = config.get("system_globals.eddystone_namespace_id", config.EDDYSTONE_NAMESPACE_ID)
+
+    # Ziel-UUID einmal pro Scan in Rohbytes umwandeln (statt String-Aufbau pro Paket)
+    ibeacon_uuid_from_config = config.get("system_globals.ibeacon_uuid", config.TARGET_IBEACON_UUID)
+    target_uuid_bytes = uuid_to_bytes(ibeacon_uuid_from_config)
+    # Typ + UUID als ein 18-Byte-Präfix: ein memcmp statt Einzel-Byte-Prüfungen pro Paket
+    ibeacon_prefix = _IBEACON_TYPE + target_uuid_bytes if target_uuid_bytes else None
+
+    # Zustandstabelle einmal binden: spart den Modul-Attributzugriff pro Paket
+    identification_state = gs.beacon_identification_state
+
+    # Pro MAC: erwartete iBeacon-Bytes (Präfix + Major + Minor) und das fertige Ergebnis-Dict.
+    # Ein Treffer ist damit ein einziger 22-Byte-Vergleich, ohne Entpacken und ohne neues Dict.
+    expected_ibeacon = {}
+    if ibeacon_prefix is not None:
+        for mac_addr, state in identification_state.items():
+            ibeacon_cfg = state.known_beacon_config.get("ibeacon") or {}
+            try:
+                major_minor_bytes = _IBEACON_MAJOR_MINOR.pack(ibeacon_cfg["major"], ibeacon_cfg["minor"])
+            except (KeyError, TypeError, struct.error):
+                continue # Kein (gültiges) iBeacon für diesen Beacon konfiguriert
+            expected_ibeacon[mac_addr] = (
+                ibeacon_prefix + major_minor_bytes,
+                {"uuid": ibeacon_uuid_from_config, "major": ibeacon_cfg["major"], "minor": ibeacon_cfg["minor"]},
+            )
+
+    # Eddystone URL: erwartete URL einmal kodieren; ein Bytevergleich ersetzt Dekodieren + lower() pro Paket.
+    # Tupel: (kodierte Bytes oder None, URL wie konfiguriert, URL in Kleinbuchstaben für den Fallback)
+    expected_url = {}
+    for mac_addr, state in identification_state.items():
+        url_cfg = state.known_beacon_config.get("eddystone_url")
+        if isinstance(url_cfg, str) and url_cfg:
+            expected_url[mac_addr] = (encode_eddystone_url(url_cfg), url_cfg, url_cfg.lower())
+
+    # Dasselbe für Eddystone UID: Namespace (10 Bytes) + Instance (6 Bytes) als 16 Rohbytes (Payload-Offset 2..18).
+    # Längen werden geprüft: eine leere/kurze ID würde sonst zu einem reinen Präfix-Vergleich.
+    # Warnungen nur, wenn das UID-Kriterium überhaupt genutzt wird (nicht DISABLED).
+    uid_criterion_enabled = (required_mask | optional_mask) & _CRITERION_UID
+    expected_uid = {}
+    namespace_bytes = None
+    if eddystone_namespace_id_from_config:
+        try:
+            namespace_bytes = bytes.fromhex(eddystone_namespace_id_from_config)
+        except (TypeError, ValueError):
+            namespace_bytes = None
+        if namespace_bytes is not None and len(namespace_bytes) != 10:
+            namespace_bytes = None
+        if namespace_bytes is None and uid_criterion_enabled:
+            log.warning("Eddystone Namespace ID in config ungültig (erwartet 20 Hex-Zeichen): %s", eddystone_namespace_id_from_config)
+    elif uid_criterion_enabled:
+        log.warning("Eddystone Namespace ID in config fehlt. Kann Eddystone UID nicht validieren.")
+    if namespace_bytes is not None:
+        for mac_addr, state in identification_state.items():
+            instance_id = (state.known_beacon_config.get("eddystone_uid") or {}).get("instance_id")
+            if instance_id is None:
+                continue # Keine Instance ID für diesen Beacon konfiguriert
+            try:
+                instance_bytes = bytes.fromhex(instance_id)
+            except (TypeError, ValueError):
+                instance_bytes = None
+            if instance_bytes is None or len(instance_bytes) != 6:
+                if uid_criterion_enabled:
+                    log.warning("Eddystone Instance ID für Beacon '%s' (%s) ungültig (erwartet 12 Hex-Zeichen): %s",
+                                state.name, mac_addr, instance_id)
+                continue
+            expected_uid[mac_addr] = (
+                namespace_bytes + instance_bytes,
+                {"namespace_id": namespace_bytes.hex().upper(), "instance_id": instance_bytes.hex().upper()},
+            )
+
+    # Frame-Typ -> (Parser, erwartete Werte pro MAC, Zielfeld in BeaconState, Kriterium-Bit)
+    eddystone_handlers = {
+        _EDDYSTONE_FRAME_UID: (_parse_eddystone_uid, expected_uid, "uid_data", _CRITERION_UID),
+        _EDDYSTONE_FRAME_URL: (_parse_eddystone_url, expected_url, "url_data", _CRITERION_URL),
+        _EDDYSTONE_FRAME_TLM: (_parse_eddystone_tlm, {}, None, 0),
+    }
+
     def detection_callback(device, advertisement_data):
         current_mac = device.address
 
-        # Nur bekannte Beacons verarbeiten, für die ein Eintrag in gs.beacon_identification_state existiert
-        if current_mac not in gs.beacon_identification_state:
-            log.trace(f"Unbekannter Beacon (nicht in config): MAC={current_mac}, RSSI={advertisement_data.rssi} dBm.")
+        # Nur bekannte Beacons verarbeiten, für die ein Eintrag in gs.beacon_identification_state existiert.
+        # Ein einziger Hash-Lookup liefert zugleich den Zustand (statt 'in' + Indexzugriff).
+        beacon_state = identification_state.get(current_mac)
+        if beacon_state is None:
+            # Häufigster Pfad (fremde Geräte): %-Argumente statt f-String, damit bei
+            # abgeschaltetem TRACE-Level kein String gebaut wird.
+            log.trace("Unbekannter Beacon (nicht in config): MAC=%s, RSSI=%s dBm.", current_mac, advertisement_data.rssi)
             return
 
-        beacon_state = gs.beacon_identification_state[current_mac]
-        beacon_cfg = beacon_state["known_beacon_config"]
-        auth_criteria = config.get("auth_criteria", {})
+        if beacon_state.is_fully_identified:
+            # Bereits identifiziert (ggf. in einem früheren Scan): kein erneutes Parsen nötig
+            beacon_state.last_packet_time = time.monotonic()
+            if beacon_state.is_allowed and not found_allowed_beacon_event.is_set():
+                found_allowed_beacon_event.set()
+                log.info(f"Event gesetzt für {beacon_state.name} ({current_mac}) - zugelassen und identifiziert.")
+            return
 
         parsed_ibeacon = None
-        parsed_eddystone_uid = None
-        parsed_eddystone_url = None
 
         # Parse iBeacon data
-        if 0x004C in advertisement_data.manufacturer_data:
-            mfg_data = advertisement_data.manufacturer_data[0x004C]
-            if len(mfg_data) >= 23 and mfg_data[0] == 0x02 and mfg_data[1] == 0x15:
-                try:
-                    ibeacon_uuid_from_config = config.get("system_globals.ibeacon_uuid", config.TARGET_IBEACON_UUID)
-                    if not ibeacon_uuid_from_config:
-                        log.warning("iBeacon UUID in config fehlt. Kann iBeacon nicht validieren.")
-                    else:
-                        uuid_bytes = mfg_data[2:18]
-                        major_val = struct.unpack_from(">H", mfg_data, 18)[0]
-                        minor_val = struct.unpack_from(">H", mfg_data, 20)[0]
-
-                        if bytes_to_uuid(uuid_bytes) == ibeacon_uuid_from_config and \
-                           major_val == beacon_cfg["ibeacon"]["major"] and \
-                           minor_val == beacon_cfg["ibeacon"]["minor"]:
-                            parsed_ibeacon = {
-                                "uuid": bytes_to_uuid(uuid_bytes),
-                                "major": major_val,
-                                "minor": minor_val
-                            }
-                        else:
-                            log.trace(f"iBeacon mismatch for {current_mac}: UUID={bytes_to_uuid(uuid_bytes)}, Major={major_val}, Minor={minor_val}")
-                except struct.error as e:
-                    log.trace(f"iBeacon struct error for {current_mac}: {e}")
-                except Exception as e:
-                    log.trace(f"iBeacon parsing error for {current_mac}: {e}")
+        mfg_data = advertisement_data.manufacturer_data.get(0x004C)
+        if mfg_data:
+            if len(mfg_data) >= 23 and ibeacon_prefix is not None and mfg_data.startswith(ibeacon_prefix):
+                expected = expected_ibeacon.get(current_mac)
+                if expected is not None and mfg_data.startswith(expected[0]):
+                    parsed_ibeacon = expected[1]
+                elif log.isEnabledFor(config.TRACE_LEVEL):
+                    # Major/Minor nur für die Diagnose entpacken
+                    major_val, minor_val = _IBEACON_MAJOR_MINOR.unpack_from(mfg_data, 18)
+                    log.trace("iBeacon mismatch for %s: Major=%s, Minor=%s", current_mac, major_val, minor_val)
+            elif len(mfg_data) >= 23 and mfg_data.startswith(_IBEACON_TYPE):
+                # iBeacon, aber nicht unserer (oder UUID nicht konfiguriert): Major/Minor werden gar nicht erst entpackt
+                if ibeacon_prefix is None:
+                    log.warning("iBeacon UUID in config fehlt. Kann iBeacon nicht validieren.")
+                elif log.isEnabledFor(config.TRACE_LEVEL):
+                    # UUID-String nur für die Diagnose bauen, der Vergleich selbst lief auf Rohbytes
+                    log.trace("iBeacon mismatch for %s: UUID=%s", current_mac, bytes_to_uuid(mfg_data[2:18]))
 
         # Parse Eddystone data (UID and URL)
-        eddystone_service_uuid_str = "0000feaa-0000-1000-8000-00805f9b34fb"
-        if eddystone_service_uuid_str in advertisement_data.service_data:
-            eddystone_payload = advertisement_data.service_data[eddystone_service_uuid_str]
+        eddystone_payload = advertisement_data.service_data.get(_EDDYSTONE_SERVICE_UUID)
+        if eddystone_payload is not None:
+            # Einmal pro Paket prüfen; hex()-Dumps werden nur bei aktivem TRACE gebaut
+            trace_enabled = log.isEnabledFor(config.TRACE_LEVEL)
 
-            log.trace(f"Raw Eddystone Payload for {current_mac}: {eddystone_payload.hex()}")
+            if trace_enabled:
+                log.trace("Raw Eddystone Payload for %s: %s", current_mac, eddystone_payload.hex())
 
-            if eddystone_payload and len(eddystone_payload) >= 1:
+            if eddystone_payload:
                 frame_type = eddystone_payload[0]
-
-                if frame_type == 0x00:  # UID Frame
-                    if len(eddystone_payload) >= 18:
-                        eddystone_namespace_id_from_config = config.get("system_globals.eddystone_namespace_id", config.EDDYSTONE_NAMESPACE_ID)
-                        if not eddystone_namespace_id_from_config:
-                            log.warning("Eddystone Namespace ID in config fehlt. Kann Eddystone UID nicht validieren.")
-                        else:
-                            namespace_id_bytes = eddystone_payload[2:12]
-                            instance_id_bytes = eddystone_payload[12:18]
-
-                            log.trace(f"UID Namespace from payload: {namespace_id_bytes.hex().upper()}")
-                            log.trace(f"UID Instance from payload: {instance_id_bytes.hex().upper()}")
-
-                            if namespace_id_bytes.hex().upper() == eddystone_namespace_id_from_config and \
-                               instance_id_bytes.hex().upper() == beacon_cfg["eddystone_uid"]["instance_id"]:
-                                parsed_eddystone_uid = {
-                                    "namespace_id": namespace_id_bytes.hex().upper(),
-                                    "instance_id": instance_id_bytes.hex().upper()
-                                }
-                            else:
-                                log.trace(f"UID mismatch for {current_mac}: Expected Namespace {eddystone_namespace_id_from_config}, Instance {beacon_cfg['eddystone_uid']['instance_id']}, got Namespace {namespace_id_bytes.hex().upper()}, Instance {instance_id_bytes.hex().upper()}")
-                    else:
-                        log.trace(f"UID payload too short for {current_mac}: {len(eddystone_payload)} bytes")
-                elif frame_type == 0x10:  # URL Frame
-                    if len(eddystone_payload) >= 3:
-                        parsed_eddystone_url = decode_eddystone_url(eddystone_payload[2:])
-                        log.trace(f"Parsed Eddystone URL for {current_mac}: {parsed_eddystone_url}")
-
-                        if parsed_eddystone_url and parsed_eddystone_url.lower() == beacon_cfg["eddystone_url"].lower():
-                            pass
-                        else:
-                            log.trace(f"URL mismatch for {current_mac}: Expected '{beacon_cfg['eddystone_url']}', got '{parsed_eddystone_url}'")
-                            parsed_eddystone_url = None
-                    else:
-                        log.trace(f"URL payload too short for {current_mac}: {len(eddystone_payload)} bytes")
-                elif frame_type == 0x20:  # TLM Frame
-                    log.trace(f"Eddystone TLM frame detected for {current_mac}. Not parsing.")
+                handler = eddystone_handlers.get(frame_type)
+                if handler is not None:
+                    parse_frame, expected_by_mac, state_field, criterion = handler
+                    parsed_value = parse_frame(eddystone_payload, current_mac, expected_by_mac.get(current_mac), trace_enabled)
+                    if parsed_value:
+                        setattr(beacon_state, state_field, parsed_value)
+                        beacon_state.criteria_mask |= criterion
                 else:
-                    log.trace(f"Unknown Eddystone Frame Type for {current_mac}: {hex(frame_type)}")
+                    log.trace("Unknown Eddystone Frame Type for %s: %#x", current_mac, frame_type)
             else:
-                log.trace(f"Empty Eddystone payload for {current_mac}")
+                log.trace("Empty Eddystone payload for %s", current_mac)
 
         # --- Update Beacon State (in globals_state) ---
         if parsed_ibeacon:
-            beacon_state['ibeacon_data'] = parsed_ibeacon
-
-        if parsed_eddystone_uid:
-            beacon_state['uid_data'] = parsed_eddystone_uid
-
-        if parsed_eddystone_url:
-            beacon_state['url_data'] = parsed_eddystone_url
+            beacon_state.ibeacon_data = parsed_ibeacon
+            beacon_state.criteria_mask |= _CRITERION_IBEACON
 
         # last_packet_time wird aktualisiert, ist aber nicht für Logik relevant
-        beacon_state['last_packet_time'] = time.time()
+        beacon_state.last_packet_time = time.monotonic()
 
         # --- Check for Full Identification ---
         # Diese Logik bleibt, da sie den 'is_fully_identified'-Status setzt, der für die Entscheidung benötigt wird.
-        if not beacon_state['is_fully_identified']:
-            is_match = True
-            matched_criteria = []
-
-            # Check iBeacon requirement
-            if auth_criteria.get("ibeacon", "DISABLED") == "REQUIRED":
-                if beacon_state['ibeacon_data']:
-                    matched_criteria.append("iBeacon")
-                else:
-                    is_match = False
-            elif auth_criteria.get("ibeacon", "DISABLED") == "OPTIONAL":
-                if beacon_state['ibeacon_data']:
-                    matched_criteria.append("iBeacon (Optional)")
-
-            # Check Eddystone UID requirement
-            if is_match and auth_criteria.get("eddystone_uid", "DISABLED") == "REQUIRED":
-                if beacon_state['uid_data']:
-                    matched_criteria.append("Eddystone UID")
-                else:
-                    is_match = False
-            elif is_match and auth_criteria.get("eddystone_uid", "DISABLED") == "OPTIONAL":
-                if beacon_state['uid_data']:
-                    matched_criteria.append("Eddystone UID (Optional)")
-
-            # Check Eddystone URL requirement
-            if is_match and auth_criteria.get("eddystone_url", "DISABLED") == "REQUIRED":
-                if beacon_state['url_data']:
-                    matched_criteria.append("Eddystone URL")
-                else:
-                    is_match = False
-            elif is_match and auth_criteria.get("eddystone_url", "DISABLED") == "OPTIONAL":
-                if beacon_state['url_data']:
-                    matched_criteria.append("Eddystone URL (Optional)")
-
-            # Check MAC Address requirement
-            if is_match and auth_criteria.get("mac_address", "DISABLED") == "REQUIRED":
-                matched_criteria.append("MAC Address")
-            elif is_match and auth_criteria.get("mac_address", "DISABLED") == "OPTIONAL":
-                matched_criteria.append("MAC Address (Optional)")
-
-            if is_match:
-                beacon_state['is_fully_identified'] = True
-                log.info(f"*** Beacon '{beacon_state['name']}' ({current_mac}) VOLLSTÄNDIG IDENTIFIZIERT! Kriterien: {', '.join(matched_criteria)} ***")
-            else:
-                missing_criteria = []
-                if auth_criteria.get("ibeacon", "DISABLED") == "REQUIRED" and not beacon_state['ibeacon_data']:
-                    missing_criteria.append("iBeacon")
-                if auth_criteria.get("eddystone_uid", "DISABLED") == "REQUIRED" and not beacon_state['uid_data']:
-                    missing_criteria.append("Eddystone UID")
-                if auth_criteria.get("eddystone_url", "DISABLED") == "REQUIRED" and not beacon_state['url_data']:
-                    missing_criteria.append("Eddystone URL")
-
-                if missing_criteria:
-                    log.debug( # Geändert von INFO zu DEBUG für Diskretion
-                        f"Identifikation für Beacon '{beacon_state['name']}' ({current_mac}) unvollständig. "
-                        f"Fehlt: {', '.join(missing_criteria)}. "
-                        f"iBeacon: {'OK' if beacon_state['ibeacon_data'] else 'N/A'}, "
-                        f"UID: {'OK' if beacon_state['uid_data'] else 'N/A'}, "
-                        f"URL: {'OK' if beacon_state['url_data'] else 'N/A'}"
-                    )
-                else:
-                    log.debug(f"Beacon '{beacon_state['name']}' ({current_mac}) not fully identified, but no REQUIRED criteria missing. Check logic.")
+        # (Hier ist der Beacon noch nicht identifiziert, siehe Short-Circuit oben.)
+        # Vorhandene Kriterien als Bitmaske (wird oben beim Parsen fortgeschrieben)
+        have = beacon_state.criteria_mask
+
+        missing = required_mask & ~have
+        if not missing:
+            beacon_state.is_fully_identified = True
+            matched_criteria = _criteria_names(have & (required_mask | optional_mask), optional_mask)
+            log.info(f"*** Beacon '{beacon_state.name}' ({current_mac}) VOLLSTÄNDIG IDENTIFIZIERT! Kriterien: {', '.join(matched_criteria)} ***")
+        elif log.isEnabledFor(logging.DEBUG):
+            log.debug( # Geändert von INFO zu DEBUG für Diskretion
+                f"Identifikation für Beacon '{beacon_state.name}' ({current_mac}) unvollständig. "
+                f"Fehlt: {', '.join(_criteria_names(missing))}. "
+                f"iBeacon: {'OK' if beacon_state.ibeacon_data else 'N/A'}, "
+                f"UID: {'OK' if beacon_state.uid_data else 'N/A'}, "
+                f"URL: {'OK' if beacon_state.url_data else 'N/A'}"
+            )
 
         # --- Wenn ein zugelassener und vollständig identifizierter Beacon gefunden wurde, signalisiere dies ---
-        if beacon_state['is_allowed'] and beacon_state['is_fully_identified']:
+        if beacon_state.is_allowed and beacon_state.is_fully_identified:
             found_allowed_beacon_event.set()
-            log.info(f"Event gesetzt für {beacon_state['name']} ({current_mac}) - zugelassen und identifiziert.") # Geändert von DEBUG zu INFO
+            log.info(f"Event gesetzt für {beacon_state.name} ({current_mac}) - zugelassen und identifiziert.") # Geändert von DEBUG zu INFO
 
     log.info(f"Starte On-Demand BLE-Scan für maximal {scan_duration} Sekunden...")
-    scanner = BleakScanner(detection_callback=detection_callback)
-    await scanner.start()
+    scanner = _create_scanner(detection_callback)
+    try:
+        await scanner.start()
+    except Exception as e:
+        if not config.get("radar_config.ble_passive_scan", False):
+            raise
+        log.warning(f"Start des passiven BLE-Scans fehlgeschlagen, verwende aktiven Scan: {e}")
+        scanner = BleakScanner(detection_callback=detection_callback)
+        await scanner.start()
     
     try:
         await asyncio.wait_for(found_allowed_beacon_event.wait(), timeout=scan_duration)
@@ -8,6 +8,7 @@
 # Modified: November 08, 2025, 11:10 UTC - CODESEND_CODE_BASIS in 'private_config.py' ausgelagert (Sicherheit).
 # Modified: November 08, 2025, 12:13 UTC - Reparatur Log-Spam: Root-Logger auf WARNING, unsere Module auf JSON-Level gesetzt.
 # Modified: November 10, 2025, 17:00 UTC - Config-Leichen entfernt: 10 ungenutzte Fallback-Konstanten gelöscht (BLE-Scanner-Ära).
+# Modified: October 16, 2026, 15:50 UTC - get(): Existenzprüfung und Zugriff zu einem dict.get() mit Sentinel zusammengefasst (ein Hash-Lookup statt zwei).
 
 import os
 import json
@@ -134,6 +135,8 @@ def read_system_config():
         print(f"FATAL CONFIG ERROR: Systemkonfigurationsdatei '{SYSTEM_CONFIG_FILE}' nicht gefunden.")
         return None
 
+_MISSING = object() # Sentinel für get(): unterscheidet "Schlüssel fehlt" von einem Wert None
+
 def get(key_path, default=None):
     """
     Ermöglicht den Zugriff auf verschachtelte Konfigurationswerte über einen Punkt-separierten Pfad.
@@ -148,9 +151,11 @@ def get(key_path, default=None):
     keys = key_path.split('.')
     current_value = SYSTEM_CONFIG
     for key in keys:
-        if isinstance(current_value, dict) and key in current_value:
-            current_value = current_value[key]
-        else:
+        if not isinstance(current_value, dict):
+            return default
+        # Ein Lookup statt 'key in d' + 'd[key]'; Sentinel, da None ein gültiger Wert sein kann
+        current_value = current_value.get(key, _MISSING)
+        if current_value is _MISSING:
             return default
     return current_value
 
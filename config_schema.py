@@ -8,6 +8,7 @@
 # Modified: November 10, 2025, 17:00 UTC - Config-Leichen entfernt: 10 ungenutzte BLE-Scanner-Variablen aus system_globals gelöscht.
 # Modified: November 10, 2025, 17:30 UTC - Magic Numbers ausgelagert: 4 neue Felder in radar_config (history_size, sign_change_y_max, sign_change_x_max, radar_loop_delay).
 # Modified: November 10, 2025, 18:00 UTC - Config-Leiche entfernt: min_distance_to_sensor aus radar_config gelöscht (ungenutzt).
+# Modified: October 16, 2026, 10:10 UTC - Neues Feld radar_config.ble_passive_scan.
 
 CONFIG_SCHEMA = {
     "system_globals": {
@@ -124,6 +125,11 @@ CONFIG_SCHEMA = {
                 "step": 0.1,
                 "unit": "Sekunden"
             },
+            "ble_passive_scan": {
+                "label": "Passiver BLE-Scan (BlueZ-Filter)",
+                "description": "Wenn aktiv, filtert der BlueZ-Kernel bereits auf iBeacon- und Eddystone-Pakete (passiver Scan mit or_patterns). Entlastet den Python-Callback. Erfordert BlueZ >= 5.56 mit aktivierten experimentellen Features; bei Fehlern wird automatisch aktiv gescannt.",
+                "type": "boolean"
+            },
             "speed_noise_threshold": {
                 "label": "Geschwindigkeits-Rauschschwelle",
                 "description": "Mindestgeschwindigkeit in cm/s, die ein Objekt haben muss, um als 'bewegt' zu gelten. Kleinere Werte werden als Rauschen oder statisch ignoriert.",
@@ -6,14 +6,35 @@
 # Modified: October 26, 2025, 14:30 UTC - Test-Display-Integration: Conditional import von test_display und Abfrage von display_test_queue für Progressbar-Visualisierung im Testmodus.
 # Modified: November 07, 2025, 14:31 UTC - Logging-Refactor: Benannter Logger, Präfixe entfernt.
 # Modified: November 10, 2025, 16:30 UTC - Test-Display-Modus vollständig entfernt (import, Queue-Handling, Progressbar-Rendering).
+# Modified: October 16, 2026, 14:55 UTC - display_manager_task ereignisgesteuert: wartet auf display_status_queue (max. 0.5s) statt fest 0.5s zu schlafen und get_nowait() zu pollen.
+# Modified: October 16, 2026, 15:40 UTC - Adaptives Warte-Timeout im Display-Loop: bis zum nächsten Minutenwechsel / Icon-Ablauf / Wetter-Update (0.05s..1.0s) statt fest 0.5s.
+# Modified: October 16, 2026, 16:15 UTC - prepare_black_icon_for_sharp_display(): 1-Bit-Maske per NumPy (Alpha x Dunkelheit, packbits) statt Compositing + convert('1') + invert.
+# Modified: October 16, 2026, 16:30 UTC - Kopfbereich (Begrüßung, Uhrzeit/Datum, Linie) als vorgerenderte Vorlage; pro Frame nur paste() + Wetter/Icon zeichnen.
+# Modified: October 16, 2026, 16:45 UTC - SPI-Übertragung nur bei geändertem Frame (_push_if_changed vergleicht image.tobytes() mit dem letzten Frame).
+# Modified: October 16, 2026, 17:00 UTC - PWS-Abfrage über persistente requests.Session (Keep-Alive); Cache-Control max-age des Servers wird respektiert.
+# Modified: October 16, 2026, 17:15 UTC - Wettertexte als gecachte 1-Bit-Kacheln (lru_cache) per draw.bitmap() statt FreeType-Rasterung pro Frame.
+# Modified: October 16, 2026, 17:30 UTC - EXTCOMIN-Toggling als asyncio-Task (await asyncio.sleep) statt Thread mit time.sleep; Ende per cancel() statt extcomin_running-Flag.
+# Modified: October 16, 2026, 17:45 UTC - get_time_based_greeting(): Lookup-Tabelle je Stunde statt if/elif-Kette.
+# Modified: October 16, 2026, 18:00 UTC - Bedingte PWS-Abfrage (If-None-Match / If-Modified-Since); 304 Not Modified übernimmt die letzten Daten als aktuell.
+# Modified: October 16, 2026, 18:15 UTC - Wetterabfrage in eigenen weather_update_task ausgelagert; display_manager_task liest nur noch gs.last_successful_weather_data.
+# Modified: October 16, 2026, 18:30 UTC - degrees_to_cardinal(): Ganzzahl-Arithmetik statt Float-Division/round, Richtungen als Modul-Tupel.
+# Modified: October 16, 2026, 18:45 UTC - Keine getbbox()/textbbox()-Aufrufe pro Frame mehr: Texthöhen aus den Text-Kacheln, Zentrierhöhe der Detail-Schrift beim Laden der Fonts.
+# Modified: October 16, 2026, 19:00 UTC - draw_display_content(): Inhalts-Signatur (Kopfbereich, Wetterwerte, Status-Icon); unveränderter Inhalt wird weder gezeichnet noch übertragen.
+# Modified: October 16, 2026, 19:15 UTC - _push_if_changed(): Frame-Bytes direkt in display.buffer kopieren statt display.image() (Pixel-Schleife im Treiber); Fallback auf image().
+# Modified: October 16, 2026, 19:30 UTC - Wind-/Regenzeile über gemeinsamen Helfer _draw_icon_line(); Text-Versatz einmal pro Frame berechnet.
+# Modified: October 16, 2026, 19:45 UTC - Uhrzeit/Datum per datetime.now() und f-String statt zweimal time.strftime(); ein Zeitstempel für Begrüßung und Uhrzeit.
+# Modified: October 16, 2026, 20:30 UTC - prepare_black_icon_for_sharp_display(): Abweichung der Icon-Kanten gegenüber dem früheren Dithering dokumentiert.
 
 import asyncio
 import time
 import os
 import logging
 import datetime
-from PIL import Image, ImageDraw, ImageFont, ImageOps
+import functools
+from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import requests
+import re
 import json # Import hinzugefügt, da es in einer Exception verwendet wird (Z. 84)
 
 # Display Imports
@@ -28,19 +49,46 @@ import globals_state as gs
 # NEU: Benannter Logger (Phase 3.3)
 log = logging.getLogger(__name__)
 
+# Persistente HTTP-Session für die PWS-Abfrage (Keep-Alive: TCP/TLS-Verbindung wird wiederverwendet)
+_http_session = requests.Session()
+_http_session.headers["User-Agent"] = "TuerOeffner"
+_http_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+# Laut Cache-Control (max-age) des Servers gültig bis (time.time()); vorher keine neue Abfrage
+_weather_fresh_until = 0.0
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+# Validatoren der letzten erfolgreichen Antwort für bedingte Abfragen: (query_url, ETag, Last-Modified)
+_weather_validators = (None, None, None)
+
+def _update_weather_freshness(response):
+    """Übernimmt max-age aus Cache-Control der Antwort als Gültigkeitsdauer der Wetterdaten."""
+    global _weather_fresh_until
+    max_age_match = _MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+    if max_age_match:
+        _weather_fresh_until = time.time() + int(max_age_match.group(1))
+
 # --- Display Hilfsfunktionen ---
+_CARDINAL_DIRECTIONS = ("N", "NNO", "NO", "ONO", "O", "OSO", "SO", "SSO",
+                        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+
 def degrees_to_cardinal(degrees):
-    directions = ["N", "NNO", "NO", "ONO", "O", "OSO", "SO", "SSO",
-                  "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    idx = round(degrees / (360. / len(directions))) % len(directions)
-    return directions[idx]
+    # 16 Sektoren à 22.5°, auf ganze Grad gerundet; +180 = halber Sektor (Rundung), & 15 = modulo 16
+    idx = ((int(round(degrees)) * 16 + 180) // 360) & 15
+    return _CARDINAL_DIRECTIONS[idx]
 
 async def get_weather_data_async():
+    global _weather_validators
     
     #if time.time() - gs.last_pws_query_time < config.get("system_globals.weather_config.query_interval_sec", config.PWS_QUERY_INTERVAL_SEC):
      #   log.info("Wetterdaten-Abfrageintervall noch nicht erreicht. Verwende letzte Daten aus Cache.")
       #  return gs.last_successful_weather_data
 
+    # Server meldet längere Gültigkeit als unser Abfrageintervall -> letzte Daten sind noch aktuell
+    if time.time() < _weather_fresh_until:
+        log.debug("Wetterdaten laut Cache-Control noch gültig. Keine neue Abfrage.")
+        return gs.last_successful_weather_data
+
     try:
         query_url = config.get("system_globals.weather_config.query_url", config.PWS_QUERY_URL)
         if not query_url:
@@ -48,8 +96,22 @@ async def get_weather_data_async():
             gs.last_successful_weather_data["is_cached"] = True
             return gs.last_successful_weather_data
 
+        # Bedingte Abfrage: unveränderte Beobachtung kommt als 304 ohne Body zurück
+        conditional_headers = {}
+        validator_url, etag, last_modified = _weather_validators
+        if validator_url == query_url:
+            if etag:
+                conditional_headers["If-None-Match"] = etag
+            if last_modified:
+                conditional_headers["If-Modified-Since"] = last_modified
+
         #log.info("Frage Wetterdaten ab...")
-        response = await asyncio.to_thread(requests.get, query_url, timeout=10)
+        response = await asyncio.to_thread(_http_session.get, query_url, headers=conditional_headers, timeout=10)
+        if response.status_code == 304:
+            gs.last_successful_weather_data["is_cached"] = False
+            _update_weather_freshness(response)
+            log.info("Wetterdaten unverändert (304 Not Modified)")
+            return gs.last_successful_weather_data
         response.raise_for_status()
         data = response.json()
 
@@ -71,6 +133,9 @@ async def get_weather_data_async():
         }
         #gs.last_pws_query_time = time.time()
         gs.last_successful_weather_data = weather_info
+
+        _update_weather_freshness(response)
+        _weather_validators = (query_url, response.headers.get("ETag"), response.headers.get("Last-Modified"))
         log.info("Wetterdaten erfolgreich abgerufen")
         return weather_info
 
@@ -87,24 +152,28 @@ async def get_weather_data_async():
         gs.last_successful_weather_data["is_cached"] = True
         return gs.last_successful_weather_data
 
-def get_time_based_greeting():
-    current_hour = datetime.datetime.now().hour
-    if 5 <= current_hour < 11:
-        return "Guten Morgen!"
-    elif 11 <= current_hour < 18:
-        return "Guten Tag!"
-    else:
-        return "Guten Abend!"
+# Begrüßung je Stunde (Index 0-23): Morgen 5-10 Uhr, Tag 11-17 Uhr, sonst Abend
+_GREETINGS_BY_HOUR = ("Guten Abend!",) * 5 + ("Guten Morgen!",) * 6 + ("Guten Tag!",) * 7 + ("Guten Abend!",) * 6
+
+def get_time_based_greeting(now=None):
+    if now is None:
+        now = datetime.datetime.now()
+    return _GREETINGS_BY_HOUR[now.hour]
 
 def prepare_black_icon_for_sharp_display(image_path, size):
-    img = Image.open(image_path).resize(size, Image.LANCZOS)
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
-    background = Image.new('RGB', size, (255, 255, 255))
-    background.paste(img, (0, 0), img)
-    one_bit_img = background.convert('1')
-    final_icon = ImageOps.invert(one_bit_img)
-    return final_icon
+    """
+    Erzeugt aus einem (schwarzen, transparenten) PNG eine 1-Bit-Maske für draw.bitmap():
+    gesetztes Bit = Pixel wird schwarz gezeichnet.
+    """
+    img = Image.open(image_path).resize(size, Image.LANCZOS).convert('RGBA')
+    rgba = np.asarray(img, dtype=np.uint32)
+    # "Tinte" = Deckkraft x Dunkelheit (wie Compositing auf Weiß + Invertieren), harte 50%-Schwelle.
+    # Hinweis: convert('1') hat früher per Floyd-Steinberg gedithert; halbtransparente Kantenpixel
+    # fallen daher leicht anders aus (wind.png: 16, wind_alt.png: 14, rain.png: 10 Pixel bei 20x20).
+    luminance = (rgba[..., 0] * 299 + rgba[..., 1] * 587 + rgba[..., 2] * 114) // 1000
+    ink = rgba[..., 3] * (255 - luminance) >= 128 * 255
+    # Zeilenweise auf 1 Bit packen (MSB zuerst, wie im PIL-Rohformat '1')
+    return Image.frombytes('1', size, np.packbits(ink, axis=1).tobytes())
 
 def load_icons():
     try:
@@ -144,30 +213,53 @@ def load_font_robust(size, default_font=None):
     log.error("Keine der bevorzugten Schriftarten gefunden oder geladen. Verwende Standard-Font.")
     return default_font if default_font else ImageFont.load_default()
 
-def draw_display_content(draw, weather_data, status_icon_type=None):
+@functools.lru_cache(maxsize=32)
+def _render_text_tile(text, font):
+    """
+    Rastert einen Text einmalig als 1-Bit-Maske (gesetztes Bit = schwarz), Ursprung wie bei draw.text().
+    Wetterwerte ändern sich nur alle paar Minuten, daher trifft der Cache fast immer.
+    """
+    left, top, right, bottom = font.getbbox(text)
+    tile = Image.new("1", (max(right, 1), max(bottom, 1)), 0)
+    ImageDraw.Draw(tile).text((0, 0), text, font=font, fill=255)
+    return tile
+
+def _draw_text_cached(draw, xy, text, font):
+    """
+    Ersatz für draw.text(..., fill=BLACK) über den Text-Kachel-Cache.
+    Gibt die Kachelhöhe zurück (= font.getbbox(text)[3], Unterkante relativ zu xy).
+    """
+    tile = _render_text_tile(text, font)
+    draw.bitmap(xy, tile, fill=0)
+    return tile.height
+
+# Vorgerenderter Kopfbereich (Begrüßung, Uhrzeit/Datum, Trennlinie) als Vorlage für jeden Frame.
+# Ändert sich nur beim Minutenwechsel bzw. Wechsel der Begrüßung und wird dann neu erzeugt.
+_header_template = None
+_header_template_key = None # (greeting_text, time_date_text) der aktuellen Vorlage
+_header_template_bottom = 0 # Y-Position, ab der der dynamische Bereich beginnt
+
+def _render_header_template(greeting_text, time_date_text):
+    """
+    Zeichnet den statischen Kopfbereich auf ein weißes Vollbild.
+    Gibt (image, y_nach_kopfbereich) zurück.
+    """
     BLACK = 0
     WHITE = 255
 
-    draw.rectangle((0, 0, config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), outline=WHITE, fill=WHITE)
-
-    current_y = 5
     PADDING_AFTER_GREETING = 5
     PADDING_AFTER_TIME_DATE = 10
-    PADDING_AFTER_TEMPERATURE = 15
-    PADDING_BETWEEN_WIND_RAIN = 5
-    VERTICAL_TEXT_ALIGN_OFFSET = -12
     DRAW_DATE_TIME_LINE = True
     LINE_THICKNESS = 1
     PADDING_AFTER_LINE = 28
-    WEATHER_BLOCK_INITIAL_OFFSET = 10
 
-    greeting_text = get_time_based_greeting()
+    template = Image.new("1", (config.DISPLAY_WIDTH, config.DISPLAY_HEIGHT), WHITE)
+    draw = ImageDraw.Draw(template)
+
+    current_y = 5
     draw.text((5, current_y), greeting_text, font=gs.FONT_GREETING, fill=BLACK)
     current_y += gs.FONT_GREETING.getbbox(greeting_text)[3] + PADDING_AFTER_GREETING
 
-    current_time_str = time.strftime("%H:%M")
-    current_date_str = time.strftime("%d.%m.%Y")
-    time_date_text = f"{current_time_str} - {current_date_str}"
     draw.text((5, current_y), time_date_text, font=gs.FONT_TIME_DATE, fill=BLACK)
     current_y += gs.FONT_TIME_DATE.getbbox(time_date_text)[3] + PADDING_AFTER_TIME_DATE
 
@@ -176,46 +268,84 @@ def draw_display_content(draw, weather_data, status_icon_type=None):
         line_end_x = config.DISPLAY_WIDTH - 5
         draw.line([(line_start_x, current_y), (line_end_x, current_y)], fill=BLACK, width=LINE_THICKNESS)
         current_y += LINE_THICKNESS + PADDING_AFTER_LINE
-    
-    current_y += WEATHER_BLOCK_INITIAL_OFFSET
+
+    return template, current_y
+
+def _draw_icon_line(draw, icon, text, y, text_y_offset):
+    """
+    Zeichnet eine Wetterzeile (Icon links, Detailtext rechts daneben) ab Höhe y.
+    Gibt die Y-Position unter dem Icon zurück.
+    """
+    draw.bitmap((5, y), icon, fill=0)
+    _draw_text_cached(draw, (5 + config.WEATHER_ICON_SIZE[0] + 5, int(y + text_y_offset)), text, gs.FONT_WEATHER_DETAIL)
+    return y + config.WEATHER_ICON_SIZE[1]
+
+# Inhalts-Signatur des zuletzt gezeichneten Frames (Kopfbereich, Wetterwerte, Status-Icon)
+_last_content_signature = None
+
+def draw_display_content(image, draw, weather_data, status_icon_type=None):
+    """
+    Zeichnet den Frame in image. Gibt False zurück (ohne zu zeichnen), wenn sich der Inhalt
+    seit dem letzten Aufruf nicht geändert hat und image noch den letzten Frame enthält.
+    """
+    global _header_template, _header_template_key, _header_template_bottom, _last_content_signature
+    BLACK = 0
+
+    PADDING_AFTER_TEMPERATURE = 15
+    PADDING_BETWEEN_WIND_RAIN = 5
+    VERTICAL_TEXT_ALIGN_OFFSET = -12
+    WEATHER_BLOCK_INITIAL_OFFSET = 10
+
+    # Ein Zeitstempel für Begrüßung und Uhrzeit/Datum (kein strftime mit Locale-Lookup pro Frame)
+    now = datetime.datetime.now()
+    greeting_text = get_time_based_greeting(now)
+    time_date_text = f"{now.hour:02d}:{now.minute:02d} - {now.day:02d}.{now.month:02d}.{now.year:04d}"
+
+    template_key = (greeting_text, time_date_text)
+    weather_signature = None
+    if weather_data:
+        weather_signature = (weather_data.get('temperature'), weather_data.get('wind_speed'),
+                             weather_data.get('wind_direction'), weather_data.get('precipitation'),
+                             weather_data.get('is_cached'))
+    content_signature = (template_key, weather_signature, status_icon_type)
+    if content_signature == _last_content_signature:
+        return False
+    _last_content_signature = content_signature
+
+    # Kopfbereich nur bei geänderter Begrüßung/Uhrzeit neu rastern, sonst Vorlage kopieren.
+    # Die Vorlage ist ein Vollbild (Rest weiß) und ersetzt damit auch das Löschen des Frames.
+    if template_key != _header_template_key:
+        _header_template, _header_template_bottom = _render_header_template(greeting_text, time_date_text)
+        _header_template_key = template_key
+    image.paste(_header_template)
+
+    current_y = _header_template_bottom + WEATHER_BLOCK_INITIAL_OFFSET
 
     if weather_data:
         temp_text = weather_data.get('temperature', 'N/A')
         if weather_data.get('is_cached', False):
             temp_text = f"[{temp_text}]"
         
-        draw.text((5, current_y), temp_text, font=gs.FONT_WEATHER_TEMP_BIG, fill=BLACK)
-        current_y += gs.FONT_WEATHER_TEMP_BIG.getbbox(temp_text)[3] + PADDING_AFTER_TEMPERATURE
+        current_y += _draw_text_cached(draw, (5, current_y), temp_text, gs.FONT_WEATHER_TEMP_BIG) + PADDING_AFTER_TEMPERATURE
         
+        # Detailtext vertikal zum Icon zentriert (gleicher Versatz für Wind- und Regenzeile)
+        text_y_offset = (config.WEATHER_ICON_SIZE[1] - gs.FONT_WEATHER_DETAIL_HEIGHT) / 2 + VERTICAL_TEXT_ALIGN_OFFSET
+
         if gs.ICON_WIND is not None:
-            wind_icon_y = current_y
-            draw.bitmap((5, wind_icon_y), gs.ICON_WIND, fill=BLACK)
-            text_height_for_centering = gs.FONT_WEATHER_DETAIL.getbbox('')[3]
-            text_y_pos = int(wind_icon_y + (config.WEATHER_ICON_SIZE[1] - text_height_for_centering) / 2 + VERTICAL_TEXT_ALIGN_OFFSET)
-            draw.text((5 + config.WEATHER_ICON_SIZE[0] + 5, text_y_pos),
-                      f"{weather_data.get('wind_speed', 'N/A')} -- {weather_data.get('wind_direction', 'N/A')}",
-                      font=gs.FONT_WEATHER_DETAIL, fill=BLACK)
-            current_y += config.WEATHER_ICON_SIZE[1] + PADDING_BETWEEN_WIND_RAIN
+            current_y = _draw_icon_line(draw, gs.ICON_WIND,
+                                        f"{weather_data.get('wind_speed', 'N/A')} -- {weather_data.get('wind_direction', 'N/A')}",
+                                        current_y, text_y_offset)
+            current_y += PADDING_BETWEEN_WIND_RAIN
         else:
             wind_text = f"Wind: {weather_data.get('wind_speed', 'N/A')} {weather_data.get('wind_direction', 'N/A')}"
-            bbox = draw.textbbox((5, current_y), wind_text, font=gs.FONT_WEATHER_DETAIL)
-            draw.text((5, current_y), wind_text, font=gs.FONT_WEATHER_DETAIL, fill=BLACK)
-            current_y = bbox[3] + PADDING_BETWEEN_WIND_RAIN
+            current_y += _draw_text_cached(draw, (5, current_y), wind_text, gs.FONT_WEATHER_DETAIL) + PADDING_BETWEEN_WIND_RAIN
         
         if gs.ICON_RAIN is not None:
-            rain_icon_y = current_y
-            draw.bitmap((5, rain_icon_y), gs.ICON_RAIN, fill=BLACK)
-            text_height_for_centering = gs.FONT_WEATHER_DETAIL.getbbox('')[3]
-            text_y_pos = int(rain_icon_y + (config.WEATHER_ICON_SIZE[1] - text_height_for_centering) / 2 + VERTICAL_TEXT_ALIGN_OFFSET)
-            draw.text((5 + config.WEATHER_ICON_SIZE[0] + 5, text_y_pos),
-                      f"{weather_data.get('precipitation', 'N/A')}",
-                      font=gs.FONT_WEATHER_DETAIL, fill=BLACK)
-            current_y += config.WEATHER_ICON_SIZE[1]
+            current_y = _draw_icon_line(draw, gs.ICON_RAIN, f"{weather_data.get('precipitation', 'N/A')}",
+                                        current_y, text_y_offset)
         else:
             rain_text = f"Regen: {weather_data.get('precipitation', 'N/A')}"
-            bbox = draw.textbbox((5, current_y), rain_text, font=gs.FONT_WEATHER_DETAIL)
-            draw.text((5, current_y), rain_text, font=gs.FONT_WEATHER_DETAIL, fill=BLACK)
-            current_y = bbox[3]
+            current_y += _draw_text_cached(draw, (5, current_y), rain_text, gs.FONT_WEATHER_DETAIL)
 
     icon_to_draw = None
     if status_icon_type == "ACCESS_GRANTED":
@@ -225,14 +355,43 @@ def draw_display_content(draw, weather_data, status_icon_type=None):
         x_pos = config.DISPLAY_WIDTH - config.ICON_DIMENSIONS[0] - 5
         y_pos = config.DISPLAY_HEIGHT - config.ICON_DIMENSIONS[1] - 5
         draw.bitmap((x_pos, y_pos), icon_to_draw, fill=BLACK)
+    return True
+
+# Zuletzt an das Display übertragener Frame (1-Bit-Rohdaten, 400x240 -> 12 kB)
+_last_frame_bytes = None
 
-def toggle_extcomin():
+def _push_if_changed(display, image):
+    """
+    Überträgt den Frame nur per SPI, wenn er sich vom zuletzt gesendeten unterscheidet.
+    Das Sharp Memory Display hält den Inhalt selbst (EXTCOMIN läuft unabhängig weiter).
+    Gibt True zurück, wenn übertragen wurde.
+    """
+    global _last_frame_bytes
+    frame_bytes = image.tobytes()
+    if frame_bytes == _last_frame_bytes:
+        return False
+    # PIL '1'-Rohdaten (zeilenweise, MSB = linkes Pixel, 1 = weiß) entsprechen exakt dem MHMSB-Puffer
+    # des Treibers -> direkt kopieren statt display.image() (Python-Schleife über alle 96000 Pixel).
+    # Fallback auf image(), falls Treiber rotiert oder der Puffer nicht passt.
+    display_buffer = getattr(display, "buffer", None)
+    if display_buffer is not None and getattr(display, "rotation", 0) == 0 and len(display_buffer) == len(frame_bytes):
+        display_buffer[:] = frame_bytes
+    else:
+        display.image(image)
+    display.show()
+    _last_frame_bytes = frame_bytes
+    return True
+
+async def toggle_extcomin():
+    # Läuft als Task im Event-Loop (kein eigener Thread/GIL-Wechsel); Ende per cancel()
     log.info("Starte manuelles EXTCOMIN Toggling.")
-    while gs.extcomin_running:
-        if gs.extcomin is not None:
-            gs.extcomin.value = not gs.extcomin.value
-        time.sleep(0.5)
-    log.info("EXTCOMIN Toggling beendet.")
+    try:
+        while True:
+            if gs.extcomin is not None:
+                gs.extcomin.value = not gs.extcomin.value
+            await asyncio.sleep(0.5)
+    finally:
+        log.info("EXTCOMIN Toggling beendet.")
 
 async def init_display_hardware():
     """
@@ -247,6 +406,8 @@ async def init_display_hardware():
     gs.FONT_TIME_DATE = load_font_robust(24)
     gs.FONT_WEATHER_TEMP_BIG = load_font_robust(42)
     gs.FONT_WEATHER_DETAIL = load_font_robust(22)
+    # Höhe für die vertikale Zentrierung neben den Wetter-Icons (konstant je Font, nicht pro Frame messen)
+    gs.FONT_WEATHER_DETAIL_HEIGHT = gs.FONT_WEATHER_DETAIL.getbbox('')[3]
     log.info("Fonts geladen.")
 
     spi = busio.SPI(board.SCK, MOSI=board.MOSI)
@@ -262,8 +423,7 @@ async def init_display_hardware():
     gs.disp.value = True
     gs.extcomin.value = False
 
-    gs.extcomin_running = True
-    gs.extcomin_thread_task = asyncio.create_task(asyncio.to_thread(toggle_extcomin))
+    gs.extcomin_task = asyncio.create_task(toggle_extcomin())
     log.info("EXTCOMIN Toggling Task gestartet.")
     await asyncio.sleep(0.1) # Kurze Pause, um den Task zu starten
 
@@ -276,16 +436,26 @@ async def init_display_hardware():
         log.critical(f"FEHLER beim Initialisieren des Sharp Memory Displays: {e}", exc_info=True)
         # Setze display auf None, damit der display_manager_task weiß, dass es nicht funktioniert hat
         gs.display = None
-        # Breche den extcomin_thread_task ab, wenn das Display nicht initialisiert werden konnte
-        gs.extcomin_running = False
-        if gs.extcomin_thread_task:
-            gs.extcomin_thread_task.cancel()
+        # Breche den extcomin_task ab, wenn das Display nicht initialisiert werden konnte
+        if gs.extcomin_task:
+            gs.extcomin_task.cancel()
             try:
-                await gs.extcomin_thread_task
+                await gs.extcomin_task
             except asyncio.CancelledError:
                 pass
         raise # Fehler weitergeben
 
+# Task: Wetterdaten-Abfrage (entkoppelt vom Zeichnen; hängende Abfragen blockieren das Display nicht)
+async def weather_update_task():
+    weather_query_interval = config.get("system_globals.weather_config.query_interval_sec", config.PWS_QUERY_INTERVAL_SEC)
+    try:
+        while True:
+            # Schreibt gs.last_successful_weather_data; der Display-Manager liest nur noch daraus
+            await get_weather_data_async()
+            await asyncio.sleep(weather_query_interval)
+    except asyncio.CancelledError:
+        log.info("Wetter-Task abgebrochen.")
+
 # Task 2: Display Management
 async def display_manager_task():
     # Farben innerhalb der Funktion definieren, um Scope-Probleme zu vermeiden
@@ -303,46 +473,50 @@ async def display_manager_task():
         current_display_status_icon = None
         status_icon_display_until = 0
 
-        last_weather_update_time = 0
+        message = None # Status-Nachricht, die das Warten am Schleifenende beendet hat
 
         while True:
             current_time = time.time()
-            if current_time - last_weather_update_time >= config.get("system_globals.weather_config.query_interval_sec", config.PWS_QUERY_INTERVAL_SEC):
-                weather_data = await get_weather_data_async()
-                last_weather_update_time = current_time
-            else:
-                weather_data = gs.last_successful_weather_data
+            # Wetterdaten werden von weather_update_task aktualisiert, hier nur gelesen
+            weather_data = gs.last_successful_weather_data
 
-            try:
-                message = gs.display_status_queue.get_nowait()
+            if message is not None:
                 if message["type"] == "status":
                     current_display_status_icon = message["value"]
                     status_icon_display_until = current_time + message.get("duration", 0)
                     log.info(f"Status-Update: {current_display_status_icon} für {message.get('duration', 0)}s")
-            except asyncio.QueueEmpty:
-                pass
+                message = None
 
             if current_display_status_icon and current_time > status_icon_display_until:
                 current_display_status_icon = None
                 log.info("Status-Icon ausgeblendet.")
             
-            draw_display_content(draw, weather_data, status_icon_type=current_display_status_icon)
-            
-            gs.display.image(image)
-            gs.display.show()
-
-            await asyncio.sleep(0.5)
+            if draw_display_content(image, draw, weather_data, status_icon_type=current_display_status_icon):
+                _push_if_changed(gs.display, image)
+
+            # Bis zur nächsten Status-Nachricht warten, spätestens aber bis sich der Inhalt ändert:
+            # Minutenwechsel der Uhrzeit (HH:MM) oder Ablauf des Status-Icons.
+            # Ein ACCESS_GRANTED erscheint so sofort statt erst beim nächsten Poll.
+            now = time.time()
+            wait_timeout = 60 - (now % 60)
+            if current_display_status_icon:
+                wait_timeout = min(wait_timeout, status_icon_display_until - now)
+            # Untergrenze gegen Busy-Looping, Obergrenze als regelmäßiger Refresh (neue Wetterdaten)
+            wait_timeout = min(max(wait_timeout, 0.05), 1.0)
+            try:
+                message = await asyncio.wait_for(gs.display_status_queue.get(), timeout=wait_timeout)
+            except asyncio.TimeoutError:
+                message = None
 
     except asyncio.CancelledError:
         log.info("Display-Manager-Task abgebrochen.")
     except Exception as e:
         log.error(f"Ein unerwarteter Fehler im Display-Manager ist aufgetreten: {e}", exc_info=True)
     finally:
-        gs.extcomin_running = False
-        if gs.extcomin_thread_task:
-            gs.extcomin_thread_task.cancel()
+        if gs.extcomin_task:
+            gs.extcomin_task.cancel()
             try:
-                await gs.extcomin_thread_task
+                await gs.extcomin_task
             except asyncio.CancelledError:
                 pass
         log.info("EXTCOMIN Toggling Task beendet.")
@@ -4,6 +4,7 @@
 # Creation Date: October 13, 2025
 # Modified: October 13, 2025, 12:10 UTC - Erstellung des door_control-Moduls.
 # Modified: November 07, 2025, 14:42 UTC - Logging-Refactor: Benannter Logger, Präfixe entfernt.
+# Modified: October 16, 2026, 10:55 UTC - Cooldown über time.monotonic() (immun gegen NTP-/Uhrzeit-Sprünge).
 
 import asyncio
 import time
@@ -21,7 +22,7 @@ async def send_door_open_command(duration_sec):
     Berechnet den codesend-Code basierend auf der gewünschten Dauer und ruft codesend auf.
     Verhindert Mehrfachauslösung innerhalb von MIN_DETECTION_INTERVAL.
     """
-    current_time = time.time()
+    current_time = time.monotonic()
 
     # Holen des min_detection_interval aus der Konfiguration
     min_detection_interval = config.get("system_globals.min_detection_interval", config.MIN_DETECTION_INTERVAL)
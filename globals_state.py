@@ -10,13 +10,14 @@
 # Modified: November 10, 2025, 17:15 UTC - Globale Variablen-Leichen entfernt: beacon_last_seen_data, beacon_is_present, last_door_opened_timestamp (BLE-Scanner-Ära).
 # Modified: November 10, 2025, 18:00 UTC - Kommentar-Leichen entfernt: 4 ungenutzte Felder aus beacon_identification_state Dokumentation gelöscht (BLE-Scanner-Ära).
 # Modified: November 10, 2025, 18:05 UTC - HOTFIX: beacon_identification_state Variable wiederhergestellt (versehentlich gelöscht).
+# Modified: October 16, 2026, 09:40 UTC - Ungenutzte Importe entfernt (time, datetime, PIL.Image).
+# Modified: October 16, 2026, 10:55 UTC - _last_codesend_time als monotonic-Zeitstempel, initial -inf (erster Befehl nie im Cooldown).
+# Modified: October 16, 2026, 12:55 UTC - Dokumentation beacon_identification_state: Werte sind ble_logic_R.BeaconState-Instanzen.
+# Modified: October 16, 2026, 17:30 UTC - extcomin_running/extcomin_thread_task durch extcomin_task ersetzt (EXTCOMIN-Toggling als asyncio-Task).
 
 import asyncio
-import time
 import atexit
 import logging
-import datetime # Für last_successful_weather_data
-from PIL import Image # Für Icon-Variablen
 
 # NEU: Benannter Logger (Phase 4.1)
 log = logging.getLogger(__name__)
@@ -25,10 +26,9 @@ log = logging.getLogger(__name__)
 display_status_queue = asyncio.Queue()
 
 # Global state to track identification progress for each beacon MAC
-# { "MAC_ADDRESS": { "name": "Beacon Name", "is_allowed": true/false,
-#                    "ibeacon_data": {}, "uid_data": {}, "url_data": "",
-#                    "last_packet_time": float, "is_fully_identified": bool,
-#                    "known_beacon_config": {} } }
+# { "MAC_ADDRESS": ble_logic_R.BeaconState(name, is_allowed, known_beacon_config,
+#                    ibeacon_data, uid_data, url_data, last_packet_time,
+#                    is_fully_identified, criteria_mask) }
 beacon_identification_state = {} 
 
 # --- Globale Display Instanzen (für cleanup) ---
@@ -36,8 +36,7 @@ display = None
 cs = None
 extcomin = None
 disp = None
-extcomin_running = False # Flag, um den EXTCOMIN-Toggle-Thread zu steuern
-extcomin_thread_task = None # NEU: Für den asyncio.Task des EXTCOMIN-Togglings
+extcomin_task = None # asyncio.Task des EXTCOMIN-Togglings (display_logic.toggle_extcomin)
 
 # --- Globale Icon Variablen ---
 ICON_KEY = None
@@ -55,7 +54,7 @@ last_successful_weather_data = {
 last_pws_query_time = 0 # Initialisiere hier, damit es nicht in der Funktion als global deklariert werden muss
 
 # --- codesend Hilfsfunktion Globals ---
-_last_codesend_time = 0
+_last_codesend_time = float('-inf') # time.monotonic()-Zeitstempel; -inf, da monotonic nach dem Booten klein ist
 
 # --- Hilfsfunktionen für GPIO-Cleanup ---
 def cleanup_gpio():
@@ -4,6 +4,8 @@
 # Author: Dr. Ralf Korell / CircuIT (basierend auf LD2450 Doku und rd03d_async.py)
 # Creation Date: November 08, 2025
 # Modified: November 08, 2025, 15:21 UTC - Erstellung des Moduls, Implementierung des Protokolls (Frame-Parsing, Sign-Magnitude-Dekodierung) und Single-Target-Konfigurationssequenz.
+# Modified: October 16, 2026, 16:00 UTC - TRACE-Meldungen pro Frame auf %-Style; hex()-Dumps und Target-Liste nur bei aktivem TRACE (isEnabledFor).
+# Modified: October 16, 2026, 20:20 UTC - Lokale Konstante _TRACE entfernt, stattdessen config.TRACE_LEVEL.
 
 import aioserial
 import asyncio
@@ -11,6 +13,8 @@ import math
 import logging
 import time
 
+import config
+
 # NEU: Benannter Logger
 log = logging.getLogger(__name__)
 
@@ -259,7 +263,7 @@ class LD2450_Async:
         for i in range(len(data) - (self.REPORT_FRAME_LEN - 1)):
             if data[i:i+4] == self.REPORT_HEADER:
                 start_idx = i
-                log.trace(f"_find_complete_frame: Start-Header gefunden bei Index {start_idx}.")
+                log.trace("_find_complete_frame: Start-Header gefunden bei Index %d.", start_idx)
                 break
         
         if start_idx == -1:
@@ -274,14 +278,14 @@ class LD2450_Async:
             if data[frame_end_idx - 2 : frame_end_idx] == self.REPORT_TAIL:
                 frame = data[start_idx : frame_end_idx]
                 remaining = data[frame_end_idx :]
-                log.trace(f"_find_complete_frame: Vollständiger Frame gefunden. Länge: {len(frame)}. Remaining: {len(remaining)} bytes.")
+                log.trace("_find_complete_frame: Vollständiger Frame gefunden. Länge: %d. Remaining: %d bytes.", len(frame), len(remaining))
                 return frame, remaining
             else:
-                log.trace(f"_find_complete_frame: Header bei {start_idx} gefunden, aber Tail FALSCH. Verwerfe Daten bis nach Header.")
+                log.trace("_find_complete_frame: Header bei %d gefunden, aber Tail FALSCH. Verwerfe Daten bis nach Header.", start_idx)
                 # Daten korrupt, verwerfe alles bis NACH diesem falschen Header
                 return None, data[start_idx + 4:]
         
-        log.trace(f"_find_complete_frame: Frame-Start bei {start_idx} gefunden, aber (noch) unvollständig.")
+        log.trace("_find_complete_frame: Frame-Start bei %d gefunden, aber (noch) unvollständig.", start_idx)
         # Frame-Start gefunden, aber noch nicht vollständig. Behalte Puffer ab Start.
         return None, data[start_idx:]
     
@@ -299,7 +303,7 @@ class LD2450_Async:
             if bytes_to_read > 0:
                 new_data = await self.uart.read_async(bytes_to_read)
                 self.buffer += new_data
-                log.trace(f"update_async: {len(new_data)} neue Bytes gelesen. Puffergröße: {len(self.buffer)}.")
+                log.trace("update_async: %d neue Bytes gelesen. Puffergröße: %d.", len(new_data), len(self.buffer))
             else:
                 log.trace("update_async: Keine neuen Bytes verfügbar.")
         except Exception as e:
@@ -308,23 +312,28 @@ class LD2450_Async:
         
         # Puffer-Management (identisch zu rd03d_async)
         if len(self.buffer) > 300:
-            log.trace(f"update_async: Puffer zu groß ({len(self.buffer)} Bytes). Kürze auf 150 Bytes.")
+            log.trace("update_async: Puffer zu groß (%d Bytes). Kürze auf 150 Bytes.", len(self.buffer))
             self.buffer = self.buffer[-150:]
 
         latest_frame = None
         temp_buffer = self.buffer
         
-        log.trace(f"update_async: Starte Frame-Parsing. Aktueller Puffer: {self.buffer.hex()}")
+        # hex()-Dumps nur bei aktivem TRACE erzeugen (pro Frame, sonst verschwendete Allokationen)
+        trace_enabled = log.isEnabledFor(config.TRACE_LEVEL)
+        if trace_enabled:
+            log.trace("update_async: Starte Frame-Parsing. Aktueller Puffer: %s", self.buffer.hex())
 
         while True:
             frame, temp_buffer = self._find_complete_frame(temp_buffer)
             if frame:
                 latest_frame = frame
-                log.trace(f"update_async: Vollständigen Frame gefunden. Puffer nach diesem Frame: {temp_buffer.hex()}")
+                if trace_enabled:
+                    log.trace("update_async: Vollständigen Frame gefunden. Puffer nach diesem Frame: %s", temp_buffer.hex())
             else:
                 # Puffer ist jetzt entweder leer oder enthält einen unvollständigen Frame
                 self.buffer = temp_buffer
-                log.trace(f"update_async: Keine weiteren Frames. Restpuffer: {self.buffer.hex()}")
+                if trace_enabled:
+                    log.trace("update_async: Keine weiteren Frames. Restpuffer: %s", self.buffer.hex())
                 break
         
         if latest_frame:
@@ -334,8 +343,9 @@ class LD2450_Async:
             
             decoded = self._decode_frame(latest_frame)
             if decoded:
-                filtered_targets = [str(t) for t in decoded]
-                log.trace(f"Targets erfolgreich dekodiert: {filtered_targets}")
+                if trace_enabled:
+                    filtered_targets = [str(t) for t in decoded]
+                    log.trace("Targets erfolgreich dekodiert: %s", filtered_targets)
                 
                 # Speichere die dekodierten Targets
                 self.targets = decoded
@@ -362,4 +372,4 @@ class LD2450_Async:
                 self.uart.close()
                 log.info("UART-Verbindung (LD2450) geschlossen.")
             except Exception as e:
-                log.error(f"Fehler beim Schließen der UART-Verbindung (LD2450): {e}")
\ No newline at end of file
+                log.error(f"Fehler beim Schließen der UART-Verbindung (LD2450): {e}")
\ No newline at end of file
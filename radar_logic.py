@@ -22,6 +22,11 @@
 # Modified: November 10, 2025, 16:30 UTC - Test-Display-Update entfernt (gs.display_test_queue.put).
 # Modified: November 10, 2025, 17:15 UTC - Ungenutzte Zuweisung entfernt: gs.last_door_opened_timestamp (Variable existiert nicht mehr).
 # Modified: November 10, 2025, 17:30 UTC - Magic Numbers nach config.json ausgelagert: HISTORY_SIZE, SIGN_CHANGE_Y_MAX, SIGN_CHANGE_X_MAX, RADAR_LOOP_DELAY durch config.get() ersetzt. DIAGNOSTIC_LOG_Y_THRESHOLD entfernt (ungenutzt).
+# Modified: October 16, 2026, 08:40 UTC - _analyze_trajectory(): Historie in einem np.asarray()-Aufruf umgewandelt, Y-Steigung in geschlossener Form (Kleinste Quadrate) statt np.polyfit.
+# Modified: October 16, 2026, 14:25 UTC - config.get() für history_size, speed_noise_threshold, expected_x_sign und radar_loop_delay einmal pro Task-Start statt pro Frame.
+# Modified: October 16, 2026, 14:40 UTC - time.monotonic() für Historie und Cooldown; Reader-Takt driftfrei (nächster Tick relativ zum geplanten, nicht zum tatsächlichen Zeitpunkt).
+# Modified: October 16, 2026, 15:25 UTC - Türöffner-Befehl als Hintergrund-Task (blockiert die State Machine nicht mehr für die Dauer von codesend); Display-Status per put_nowait().
+# Modified: October 16, 2026, 16:00 UTC - Logging pro Frame (Block B, Historie, Intent) auf %-Style umgestellt (Formatierung nur bei aktivem Level).
 
 import asyncio
 import time
@@ -101,6 +106,7 @@ class _RadarState:
 # --- NEU: Globale (modulinterne) Instanzen ---
 _state = _RadarState()              # Die einzige Instanz unseres Zustands
 _radar_queue = asyncio.Queue(maxsize=1) # Pipeline zwischen I/O und Logik
+_background_tasks = set()               # Starke Referenzen auf laufende Fire-and-Forget-Tasks (z.B. codesend)
 
 
 async def init_radar_hardware():
@@ -133,26 +139,26 @@ def _analyze_trajectory(history: deque, expected_sign: str, noise_threshold_cm_s
     """
     
     # 1. Daten für Regression extrahieren
-    # Wir verwenden Tupel (timestamp, x, y)
+    # Wir verwenden Tupel (timestamp, x, y) -> eine (N, 3)-Matrix in einem Schritt
     try:
-        timestamps = np.array([entry[0] for entry in history])
-        y_positions = np.array([entry[2] for entry in history])
-        x_positions = np.array([entry[1] for entry in history])
-    except IndexError:
+        data = np.asarray(history, dtype=float)
+        timestamps = data[:, 0]
+        x_positions = data[:, 1]
+        y_positions = data[:, 2]
+    except (IndexError, ValueError):
         log.warning("_analyze_trajectory: Historie scheint korrupt oder leer.")
         return "NEUTRAL"
 
     # 2. Y-Trend (Geschwindigkeit) berechnen
-    # Zeit normalisieren (verhindert numerische Instabilität bei großen Zeitstempeln)
-    timestamps_norm = timestamps - timestamps[0]
-    
-    # np.polyfit(grad=1) ist eine lineare Regression. [0] ist die Steigung (m).
+    # Lineare Regression (Grad 1) in geschlossener Form: m = Σ(t-t̄)(y-ȳ) / Σ(t-t̄)²
+    # Das Zentrieren der Zeit verhindert numerische Instabilität bei großen Zeitstempeln.
     # Das Ergebnis ist in [mm / Sekunde], da Y in mm und Zeit in Sekunden ist.
-    try:
-        y_slope_mm_per_sec = np.polyfit(timestamps_norm, y_positions, 1)[0]
-    except np.linalg.LinAlgError:
-        log.warning("_analyze_trajectory: Lineare Regression fehlgeschlagen (LinAlgError).")
+    timestamps_centered = timestamps - timestamps.mean()
+    denominator = np.dot(timestamps_centered, timestamps_centered)
+    if denominator == 0.0:
+        log.warning("_analyze_trajectory: Lineare Regression fehlgeschlagen (identische Zeitstempel).")
         return "NEUTRAL"
+    y_slope_mm_per_sec = np.dot(timestamps_centered, y_positions - y_positions.mean()) / denominator
 
     # Schwellenwert von cm/s in mm/s umrechnen
     noise_threshold_mm_per_sec = noise_threshold_cm_s * 10.0
@@ -201,7 +207,7 @@ async def _check_and_trigger_door() -> bool:
     current_y = current_entry[2] # Y-Position des aktuellen Frames
     prev_x = prev_entry[1]
     
-    log.debug(f"Block B: Vorzeichenwechsel-Check: prev_x={prev_x}, current_x={current_x}, y={current_y}")
+    log.debug("Block B: Vorzeichenwechsel-Check: prev_x=%s, current_x=%s, y=%s", prev_x, current_x, current_y)
     
     # Lade Schwellenwerte aus Config
     sign_change_y_max = config.get("radar_config.sign_change_y_max", 500)
@@ -216,16 +222,16 @@ async def _check_and_trigger_door() -> bool:
             if (expected_x_sign == "negative" and prev_x < 0 and prev_x > -sign_change_x_max) or \
                (expected_x_sign == "positive" and prev_x > 0 and prev_x < sign_change_x_max):
                 valid_sign_change_detected = True
-                log.info(f"Block B: X-Vorzeichenwechsel erkannt (von {prev_x} zu 0, y={current_y}mm). Türöffnungszeitpunkt erreicht.")
+                log.info("Block B: X-Vorzeichenwechsel erkannt (von %s zu 0, y=%smm). Türöffnungszeitpunkt erreicht.", prev_x, current_y)
             else:
-                log.debug(f"Block B: X=0 verworfen (prev_x={prev_x}). Falsche Richtung (expected: {expected_x_sign}).")
+                log.debug("Block B: X=0 verworfen (prev_x=%s). Falsche Richtung (expected: %s).", prev_x, expected_x_sign)
         else:
-            log.debug(f"Block B: X=0 verworfen (prev_x={prev_x}, y={current_y}mm). Schwellenwerte überschritten.")
+            log.debug("Block B: X=0 verworfen (prev_x=%s, y=%smm). Schwellenwerte überschritten.", prev_x, current_y)
     
     # Fall 2: Echter +/- Wechsel
     elif prev_x * current_x < 0:
         valid_sign_change_detected = True
-        log.info(f"Block B: X-Vorzeichenwechsel erkannt (von {prev_x} zu {current_x}, y={current_y}mm). Türöffnungszeitpunkt erreicht.")
+        log.info("Block B: X-Vorzeichenwechsel erkannt (von %s zu %s, y=%smm). Türöffnungszeitpunkt erreicht.", prev_x, current_x, current_y)
     
     if valid_sign_change_detected:
         _state.x_sign_changed = True
@@ -235,11 +241,15 @@ async def _check_and_trigger_door() -> bool:
             await asyncio.sleep(comfort_delay)
         
         relay_duration = config.get("system_globals.relay_activation_duration_sec", 4)
-        await door_control.send_door_open_command(relay_duration)
-        await gs.display_status_queue.put({"type": "status", "value": "ACCESS_GRANTED", "duration": 5})
+        # codesend läuft als eigener Task weiter; die State Machine wechselt sofort in den Cooldown.
+        # (send_door_open_command fängt seine Fehler selbst ab und loggt sie.)
+        door_task = asyncio.create_task(door_control.send_door_open_command(relay_duration))
+        _background_tasks.add(door_task)
+        door_task.add_done_callback(_background_tasks.discard)
+        gs.display_status_queue.put_nowait({"type": "status", "value": "ACCESS_GRANTED", "duration": 5}) # Unbegrenzte Queue
         
         cooldown_duration = config.get("radar_config.cooldown_duration", 3.0)
-        _state.cooldown_end_time = time.time() + cooldown_duration
+        _state.cooldown_end_time = time.monotonic() + cooldown_duration
         
         log.info("Block B: Tür geöffnet und Cooldown-Timer gesetzt.")
         return True
@@ -302,6 +312,9 @@ async def radar_reader_task():
         return
 
     log.info("Starte Radar Reader Task (I/O)...")
+    # Konfiguration ändert sich zur Laufzeit nicht (wird nur beim Import geladen): einmal lesen
+    radar_loop_delay = config.get("radar_config.radar_loop_delay", 0.05)
+    next_tick = time.monotonic()
     try:
         while True:
             updated = await _radar_device.update_async()
@@ -318,7 +331,15 @@ async def radar_reader_task():
                  # Sollte durch die Logik oben nie passieren
                 log.warning("Radar-Queue ist voll, verwerfe Frame.")
             
-            await asyncio.sleep(config.get("radar_config.radar_loop_delay", 0.05))
+            # Driftfreier Takt: nächster Tick relativ zum geplanten Zeitpunkt, damit sich
+            # die Laufzeit von update_async() nicht auf die Polling-Rate aufsummiert.
+            next_tick += radar_loop_delay
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Hinterher (z.B. langsamer UART-Read): verpasste Ticks nicht nachholen
+                next_tick = time.monotonic()
+                delay = 0
+            await asyncio.sleep(delay)
     
     except asyncio.CancelledError:
         log.info("Radar Reader Task abgebrochen.")
@@ -339,11 +360,16 @@ async def radar_logic_task():
     global _state, _radar_queue
     log.info("Starte Radar Logic Task (State Machine)...")
 
+    # Konfiguration ändert sich zur Laufzeit nicht (wird nur beim Import geladen): einmal lesen
+    required_history_size = config.get("radar_config.history_size", 7)
+    noise_threshold = config.get("radar_config.speed_noise_threshold", 5)
+    expected_x_sign = config.get("radar_config.expected_x_sign", "negative")
+
     try:
         while True:
             # 1. Warte auf nächstes Datenpaket (Target oder None)
             target = await _radar_queue.get()
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # --- Zustand 1: COOLDOWN ---
             if _state.system_state == SystemState.COOLDOWN:
@@ -380,15 +406,11 @@ async def radar_logic_task():
 
                 # D. (Parallel 2) Intent-Logik (Block A) ausführen
                 # Wir brauchen eine volle Historie für eine stabile Trendanalyse
-                required_history_size = config.get("radar_config.history_size", 7)
                 if len(_state.history) < required_history_size:
-                    log.trace(f"Warte auf volle Historie ({len(_state.history)}/{required_history_size} Frames)...")
+                    log.trace("Warte auf volle Historie (%d/%d Frames)...", len(_state.history), required_history_size)
                     continue
 
                 # Historie ist voll, Trend analysieren
-                noise_threshold = config.get("radar_config.speed_noise_threshold", 5)
-                expected_x_sign = config.get("radar_config.expected_x_sign", "negative")
-                
                 trend_str = _analyze_trajectory(_state.history, expected_x_sign, noise_threshold)
 
                 # Intent-Status aktualisieren
@@ -399,7 +421,7 @@ async def radar_logic_task():
                     new_intent = IntentStatus.GEHEN
                 
                 if _state.intent_status != new_intent and new_intent != IntentStatus.NEUTRAL:
-                    log.info(f"Intent-Status: {_state.intent_status.name} -> {new_intent.name}")
+                    log.info("Intent-Status: %s -> %s", _state.intent_status.name, new_intent.name)
                     _state.intent_status = new_intent
 
                 # E. Reset-Bedingungen (Intent = GEHEN)
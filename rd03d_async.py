@@ -16,11 +16,14 @@
 # Modified: November 02, 2025, 16:55 UTC - Korrektur (Root Cause Fix): self.targets speichert nur noch Targets mit distance > 0.
 # Modified: November 07, 2025, 12:55 UTC - Logging-Refactor: Benannter Logger, DEBUG->TRACE, Präfixe entfernt, gs.TRACE_MODE entfernt.
 # Modified: November 08, 2025, 15:59 UTC - connect() Default auf multi_mode=False geändert.
+# Modified: October 16, 2026, 16:00 UTC - TRACE-Meldungen pro Frame auf %-Style; hex()-Dumps und Target-Liste nur bei aktivem TRACE (isEnabledFor).
+# Modified: October 16, 2026, 20:20 UTC - Lokale Konstante _TRACE entfernt, stattdessen config.TRACE_LEVEL.
 
 import aioserial
 import asyncio
 import math
 import logging
+import config
 import globals_state as gs
 
 # NEU: Benannter Logger (Phase 2.1)
@@ -99,7 +102,8 @@ class RD03D_Async:
         expected_len = 30 
 
         if len(data) < expected_len or data[0] != 0xAA or data[1] != 0xFF or data[-2] != 0x55 or data[-1] != 0xCC:
-            log.trace(f"_decode_frame: Invalid frame format or length {len(data)} (expected {expected_len}). Data: {data.hex()}")
+            if log.isEnabledFor(config.TRACE_LEVEL):
+                log.trace("_decode_frame: Invalid frame format or length %d (expected %d). Data: %s", len(data), expected_len, data.hex())
             return targets
         
         num_targets_in_frame = 3 
@@ -121,7 +125,7 @@ class RD03D_Async:
         for i in range(len(data) - 1):
             if data[i] == 0xAA and data[i+1] == 0xFF:
                 start_idx = i
-                log.trace(f"_find_complete_frame: Start-Marker gefunden bei Index {start_idx}.")
+                log.trace("_find_complete_frame: Start-Marker gefunden bei Index %d.", start_idx)
                 break
         
         if start_idx == -1:
@@ -132,10 +136,10 @@ class RD03D_Async:
             if data[start_idx + expected_frame_len - 2] == 0x55 and data[start_idx + expected_frame_len - 1] == 0xCC:
                 frame = data[start_idx : start_idx + expected_frame_len]
                 remaining = data[start_idx + expected_frame_len :]
-                log.trace(f"_find_complete_frame: Vollständiger Frame gefunden. Länge: {len(frame)}. Remaining: {len(remaining)} bytes.")
+                log.trace("_find_complete_frame: Vollständiger Frame gefunden. Länge: %d. Remaining: %d bytes.", len(frame), len(remaining))
                 return frame, remaining
         
-        log.trace(f"_find_complete_frame: Frame-Start bei {start_idx} gefunden, aber kein vollständiger Frame (erwartet {expected_frame_len} Bytes) oder kein Ende.")
+        log.trace("_find_complete_frame: Frame-Start bei %d gefunden, aber kein vollständiger Frame (erwartet %d Bytes) oder kein Ende.", start_idx, expected_frame_len)
         return None, data[start_idx:]
     
     async def update_async(self):
@@ -149,7 +153,8 @@ class RD03D_Async:
             if bytes_to_read > 0:
                 new_data = await self.uart.read_async(bytes_to_read)
                 self.buffer += new_data
-                log.trace(f"update_async: {len(new_data)} neue Bytes gelesen. Puffergröße: {len(self.buffer)}. Neue Daten: {new_data.hex()}")
+                if log.isEnabledFor(config.TRACE_LEVEL):
+                    log.trace("update_async: %d neue Bytes gelesen. Puffergröße: %d. Neue Daten: %s", len(new_data), len(self.buffer), new_data.hex())
             else:
                 log.trace("update_async: Keine neuen Bytes verfügbar.")
         except Exception as e:
@@ -157,19 +162,23 @@ class RD03D_Async:
             return False
         
         if len(self.buffer) > 300:
-            log.trace(f"update_async: Puffer zu groß ({len(self.buffer)} Bytes). Kürze auf 150 Bytes.")
+            log.trace("update_async: Puffer zu groß (%d Bytes). Kürze auf 150 Bytes.", len(self.buffer))
             self.buffer = self.buffer[-150:]
 
         latest_frame = None
         temp_buffer = self.buffer
         
-        log.trace(f"update_async: Starte Frame-Parsing. Aktueller Puffer: {self.buffer.hex()}")
+        # hex()-Dumps nur bei aktivem TRACE erzeugen (pro Frame, sonst verschwendete Allokationen)
+        trace_enabled = log.isEnabledFor(config.TRACE_LEVEL)
+        if trace_enabled:
+            log.trace("update_async: Starte Frame-Parsing. Aktueller Puffer: %s", self.buffer.hex())
 
         while True:
             frame, temp_buffer = self._find_complete_frame(temp_buffer)
             if frame:
                 latest_frame = frame
-                log.trace(f"update_async: Vollständigen Frame gefunden. Puffer nach diesem Frame: {temp_buffer.hex()}")
+                if trace_enabled:
+                    log.trace("update_async: Vollständigen Frame gefunden. Puffer nach diesem Frame: %s", temp_buffer.hex())
             else:
                 log.trace("update_async: Keine weiteren vollständigen Frames gefunden.")
                 break
@@ -179,7 +188,8 @@ class RD03D_Async:
             frame_start_index = self.buffer.rfind(latest_frame)
             if frame_start_index != -1:
                 self.buffer = self.buffer[frame_start_index + len(latest_frame):]
-                log.trace(f"update_async: Puffer nach Bereinigung (Start des letzten Frames): {self.buffer.hex()}")
+                if trace_enabled:
+                    log.trace("update_async: Puffer nach Bereinigung (Start des letzten Frames): %s", self.buffer.hex())
             else:
                 log.warning("update_async: latest_frame nicht im Puffer gefunden, Puffer wird geleert.")
                 self.buffer = b''
@@ -187,10 +197,11 @@ class RD03D_Async:
             decoded = self._decode_frame(latest_frame)
             if decoded:
                 # KORREKTUR: Filtere leere Targets für das Debug-Log
-                filtered_targets = [str(t) for t in decoded if t.distance > 0]
-                
-                # NEU (Konsolidiert auf log.trace):
-                log.trace(f"Targets erfolgreich dekodiert: {filtered_targets}")
+                if trace_enabled:
+                    filtered_targets = [str(t) for t in decoded if t.distance > 0]
+                    
+                    # NEU (Konsolidiert auf log.trace):
+                    log.trace("Targets erfolgreich dekodiert: %s", filtered_targets)
                 
                 # KORRIGIERTE ZEILE (wie besprochen): Speichere nur Targets, die keine Artefakte (distance=0) sind
                 self.targets = [t for t in decoded if t.distance > 0]